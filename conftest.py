@@ -0,0 +1,14 @@
+"""Shared pytest fixtures for the scraper tests."""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def driver():
+    """One headless Chrome shared by every browser test in the session."""
+    # Imported here so tests that never use a browser do not load Selenium
+    from src.utils.webdriver_manager import WebDriverManager
+    
+    manager = WebDriverManager(headless=True)
+    yield manager.get_driver()
+    manager.quit_driver()
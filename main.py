@@ -3,31 +3,30 @@ RateMyProfessor Scraper for University of South Florida
 Main entry point with command-line interface
 """
 import argparse
+import asyncio
+import os
 import sys
 import logging
-import json
 import time
-import random
+from contextlib import aclosing
 from pathlib import Path
-from typing import List
-
-from src.utils.webdriver_manager import WebDriverManager
-from src.scrapers.list_scraper import ProfessorListScraper
-from src.scrapers.detail_scraper import ProfessorDetailScraper
-from src.utils.json_writer import JSONWriter
-from src.models import Professor
+from typing import AsyncIterator, Callable, Iterator, List, Optional, Tuple
 
+import httpx
+import orjson
 
-def setup_logging():
-    """Configure logging for the scraper"""
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('scraper.log'),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+from src.scrapers.async_detail_scraper import fetch_professor
+from src.scrapers import graphql_client
+from src.utils.atomic_file import atomic_open
+from src.utils.cleaner import DataCleaner
+from src.utils.driver_pool import DriverPool
+from src.utils.error_handler import ErrorHandler
+from src.utils.json_writer import JSONWriter
+from src.utils.logger import setup_logging
+from src.utils.professor_cache import ProfessorCache
+from src.utils.token_bucket import TokenBucket
+from src.utils.validation import validate_summaries, validate_professor_records
+from src.models import Professor, ProfessorSummary
 
 
 def parse_arguments():
@@ -64,112 +63,299 @@ def parse_arguments():
         help='Maximum number of professors to scrape (for testing)'
     )
     
-    return parser.parse_args()
+    parser.add_argument(
+        '--pretty',
+        action='store_true',
+        help='Indent JSON output files for readability (default: compact)'
+    )
+    
+    parser.add_argument(
+        '--ndjson-only',
+        action='store_true',
+        help='Only write the streamed NDJSON output, skipping the combined JSON array'
+    )
+    
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=20,
+        help='Maximum number of concurrent professor page requests (default: 20)'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Re-fetch every professor instead of reusing results cached by earlier runs'
+    )
+    
+    parser.add_argument(
+        '--use-browser',
+        action='store_true',
+        help='Page through the listing with Selenium and render pages the API cannot '
+             'serve in browser workers (default: HTTP only)'
+    )
+    
+    parser.add_argument(
+        '--browser-workers',
+        type=int,
+        default=min(4, os.cpu_count() or 1),
+        help='Browser processes used with --use-browser; 0 disables (default: one per CPU core, at most 4)'
+    )
+    
+    args = parser.parse_args()
+    if args.delay <= 0:
+        parser.error('--delay must be greater than 0')
+    if args.concurrency < 1:
+        parser.error('--concurrency must be at least 1')
+    if args.browser_workers < 0:
+        parser.error('--browser-workers must not be negative')
+    
+    return args
+
+
+async def _run(list_summaries: Callable[[httpx.AsyncClient], AsyncIterator[ProfessorSummary]], args, out) -> Tuple[
+        List[ProfessorSummary], List[Tuple[ProfessorSummary, Optional[int], Optional[Exception]]]]:
+    """
+    Scrape the professor listing and professor details as one pipeline.
+    
+    A producer task pages through the listing and queues each professor as
+    soon as its card is extracted, while args.concurrency consumer tasks fetch
+    details from the queue. Each professor is written to the NDJSON output as
+    soon as it is scraped.
+    
+    Args:
+        list_summaries: Called with the run's HTTP client to get the async
+            iterator of professor summaries from the listing
+        args: Parsed command-line arguments
+        out: Open NDJSON output file
+        
+    Returns:
+        Tuple of (professor_summaries, results). results holds
+        (summary, review_count, error) tuples in completion order;
+        review_count is None when the professor could not be scraped.
+    """
+    logger = logging.getLogger(__name__)
+    start_time = time.time()
+    # At most 64 professors wait in the queue; the extra slots are reserved
+    # for the end-of-listing sentinels so they never block
+    pending = asyncio.Semaphore(64)
+    queue = asyncio.Queue(maxsize=64 + args.concurrency)
+    professor_summaries = []
+    results = []
+    successful_count = 0
+    failed_count = 0
+    total_reviews = 0
+    last_log = 0.0
+    
+    # The HTTP client belongs to this run and is closed when the pipeline ends
+    client = graphql_client.create_client()
+    summaries = list_summaries(client)
+    
+    # Shared limiter keeps the average request rate at one per args.delay seconds
+    bucket = TokenBucket(rate=1 / args.delay, capacity=max(1, int(2 / args.delay)))
+    
+    # Professors scraped by earlier runs are replayed from disk; --no-cache
+    # skips the lookup but still refreshes the cache
+    cache = ProfessorCache()
+    
+    # Browsers are a last resort for professors the HTTP paths cannot parse
+    driver_pool = None
+    if args.use_browser and args.browser_workers > 0:
+        driver_pool = DriverPool(args.browser_workers, args.headless)
+    
+    # Transient network failures are retried with exponential backoff
+    error_handler = ErrorHandler(max_retries=3)
+    
+    def _is_transient(error):
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code == 429 or error.response.status_code >= 500
+        return isinstance(error, httpx.TransportError)
+    
+    async def _scrape(url):
+        await bucket.acquire()
+        try:
+            professor = await graphql_client.query_professor(client, url)
+            if professor is None:
+                # Fall back to the data embedded in the professor page
+                professor = await fetch_professor(client, url)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code in (429, 503):
+                bucket.backoff()
+            raise
+        
+        if professor is None and driver_pool is not None:
+            # Render the page in a worker browser as a last resort
+            await bucket.acquire()
+            professor = await driver_pool.scrape(url)
+        bucket.recover()
+        return professor
+    
+    async def _fetch(prof_summary):
+        url = prof_summary.professor_page_url
+        cache_key = graphql_client.teacher_node_id(url) or url
+        if not args.no_cache:
+            professor = cache.get(cache_key)
+            if professor is not None:
+                return professor, None
+        
+        try:
+            professor = await error_handler.retry_with_backoff_async(
+                _scrape, url, is_retryable=_is_transient
+            )
+        except Exception as e:
+            return None, e
+        
+        if professor is not None:
+            cache.set(cache_key, professor)
+        return professor, None
+    
+    async def _produce():
+        async with aclosing(summaries):
+            async for prof_summary in summaries:
+                # Cards without a name or professor link cannot be scraped;
+                # the remaining fields are validated in bulk after the run
+                url = prof_summary.professor_page_url
+                if not (prof_summary.professor_name or '').strip() or graphql_client.teacher_node_id(url) is None:
+                    logger.warning(f"Skipping listing card without a name or professor link: {url}")
+                    continue
+                professor_summaries.append(prof_summary)
+                await pending.acquire()
+                queue.put_nowait(prof_summary)
+        
+        # One sentinel per consumer signals the end of the listing. On errors
+        # or cancellation the task group cancels the consumers instead.
+        for _ in range(args.concurrency):
+            queue.put_nowait(None)
+    
+    async def _consume():
+        nonlocal successful_count, failed_count, total_reviews, last_log
+        
+        while True:
+            prof_summary = await queue.get()
+            if prof_summary is None:
+                break
+            pending.release()
+            
+            professor, error = await _fetch(prof_summary)
+            
+            if professor:
+                out.write(orjson.dumps(professor, option=orjson.OPT_APPEND_NEWLINE))
+                results.append((prof_summary, len(professor.reviews), None))
+                successful_count += 1
+                total_reviews += len(professor.reviews)
+                logger.info(f"✓ Successfully scraped {prof_summary.professor_name} "
+                          f"({len(professor.reviews)} reviews)")
+            else:
+                results.append((prof_summary, None, error))
+                failed_count += 1
+                logger.warning(f"✗ Failed to scrape professor {prof_summary.professor_name}: "
+                               f"{error or 'professor not found'}")
+            
+            # Display progress against the professors found so far, at most
+            # once per second or every 10 professors
+            idx = len(results)
+            if idx % 10 != 0 and time.monotonic() - last_log <= 1.0:
+                continue
+            last_log = time.monotonic()
+            
+            found = len(professor_summaries)
+            elapsed_time = time.time() - start_time
+            
+            logger.info(f"Progress: {idx}/{found} found | "
+                      f"Elapsed: {elapsed_time/60:.1f}m | "
+                      f"Success: {successful_count} | Failed: {failed_count}")
+            
+            # Log a fuller update at regular intervals (every 10 professors)
+            if idx % 10 == 0:
+                logger.info("=" * 60)
+                logger.info(f"PROGRESS UPDATE: {idx}/{found} professors processed")
+                logger.info(f"Successful: {successful_count} | Failed: {failed_count}")
+                logger.info(f"Total reviews collected: {total_reviews}")
+                logger.info(f"Time elapsed: {elapsed_time/60:.1f} minutes")
+                logger.info("=" * 60)
+    
+    try:
+        async with client, asyncio.TaskGroup() as tg:
+            tg.create_task(_produce())
+            for _ in range(args.concurrency):
+                tg.create_task(_consume())
+    finally:
+        if driver_pool is not None:
+            await asyncio.to_thread(driver_pool.close)
+    
+    return professor_summaries, results
 
 
-def run_scraping_workflow(args) -> tuple[List[Professor], List[str], List[str]]:
+def run_scraping_workflow(args) -> tuple[int, List[str], List[str]]:
     """
     Main scraping workflow that orchestrates all scraping operations.
     
+    Scraped professors are streamed to args.output + ".ndjson", one JSON
+    record per line, so memory stays flat and a crash keeps completed work.
+    
     Args:
         args: Parsed command-line arguments
         
     Returns:
-        Tuple of (professors, errors, skipped_professors)
+        Tuple of (scraped_count, errors, skipped_professors)
     """
     logger = logging.getLogger(__name__)
-    professors = []
     start_time = time.time()
+    successful_count = 0
+    errors = []
+    skipped_professors = []
     
-    # Initialize WebDriverManager
-    logger.info("Initializing WebDriver...")
-    webdriver_manager = WebDriverManager(headless=args.headless, timeout=10)
-    driver = webdriver_manager.get_driver()
+    webdriver_manager = None
     
     try:
-        # Run ProfessorListScraper to get all professor URLs
         logger.info("Starting professor list scraping...")
         base_url = "https://www.ratemyprofessors.com/search/professors/1262?q=*"
-        list_scraper = ProfessorListScraper(driver, base_url)
         
-        professor_summaries = list_scraper.scrape(save_output=True, output_file="usf_professors_main.json")
+        # The listing stops paginating once max-professors is reached
+        if args.use_browser:
+            # Selenium is only imported for the browser listing path
+            from src.utils.webdriver_manager import WebDriverManager
+            from src.scrapers.list_scraper import ProfessorListScraper
+            
+            logger.info("Initializing WebDriver...")
+            webdriver_manager = WebDriverManager(headless=args.headless, timeout=10)
+            list_scraper = ProfessorListScraper(webdriver_manager.get_driver(), base_url)
+            list_summaries = lambda client: list_scraper.iter_summaries(max_items=args.max_professors)
+        else:
+            list_summaries = lambda client: graphql_client.iter_professor_summaries(
+                client, base_url, max_items=args.max_professors
+            )
         
-        # Apply max-professors limit if specified
-        if args.max_professors:
-            professor_summaries = professor_summaries[:args.max_professors]
-            logger.info(f"Limited to {args.max_professors} professors for testing")
+        # Fetch professor details through the GraphQL API while the listing is still paginating
+        with open(args.output + ".ndjson", "wb", buffering=1 << 20) as out:
+            professor_summaries, results = asyncio.run(_run(list_summaries, args, out))
         
-        total_professors = len(professor_summaries)
-        logger.info(f"Found {total_professors} professors to scrape")
+        JSONWriter(pretty=args.pretty).write_json(professor_summaries, "usf_professors_main.json")
+        
+        # Validate all listing cards in one pass now that scraping is done
+        for problem in validate_summaries(professor_summaries):
+            logger.warning(f"Invalid professor summary: {problem}")
+            errors.append(f"Invalid professor summary: {problem}")
         
-        # Initialize detail scraper
-        detail_scraper = ProfessorDetailScraper(driver)
+        total_professors = len(professor_summaries)
         
         # Track progress metrics
-        successful_count = 0
         failed_count = 0
         total_reviews = 0
-        errors = []
-        skipped_professors = []
         
-        # Loop through each professor URL
-        for idx, prof_summary in enumerate(professor_summaries, 1):
-            try:
-                # Calculate and display progress
-                progress_pct = (idx / total_professors) * 100
-                elapsed_time = time.time() - start_time
-                
-                # Estimate time remaining based on average time per professor
-                if idx > 1:
-                    avg_time_per_prof = elapsed_time / (idx - 1)
-                    remaining_profs = total_professors - idx + 1
-                    estimated_remaining = avg_time_per_prof * remaining_profs
-                    eta_minutes = estimated_remaining / 60
-                    
-                    logger.info(f"Progress: {idx}/{total_professors} ({progress_pct:.1f}%) | "
-                              f"Elapsed: {elapsed_time/60:.1f}m | "
-                              f"ETA: {eta_minutes:.1f}m | "
-                              f"Success: {successful_count} | Failed: {failed_count}")
-                
-                logger.info(f"Processing professor {idx}/{total_professors}: {prof_summary.professor_name}")
-                
-                # Add rate limiting with randomized delay
-                if idx > 1:  # Skip delay for first professor
-                    delay = args.delay + random.uniform(-0.3, 0.3)  # Randomize delay slightly
-                    logger.debug(f"Waiting {delay:.2f} seconds before next request...")
-                    time.sleep(delay)
-                
-                # For each URL: run ProfessorDetailScraper and ReviewScraper
-                professor = detail_scraper.scrape_professor(prof_summary.professor_page_url)
-                
-                # Collect Professor objects
-                if professor:
-                    professors.append(professor)
-                    successful_count += 1
-                    total_reviews += len(professor.reviews)
-                    logger.info(f"✓ Successfully scraped {prof_summary.professor_name} "
-                              f"({len(professor.reviews)} reviews)")
-                else:
-                    failed_count += 1
-                    skipped_professors.append(prof_summary.professor_name)
-                    logger.warning(f"✗ Failed to scrape professor: {prof_summary.professor_name}")
-                
-                # Log progress at regular intervals (every 10 professors)
-                if idx % 10 == 0:
-                    logger.info("=" * 60)
-                    logger.info(f"PROGRESS UPDATE: {idx}/{total_professors} professors processed")
-                    logger.info(f"Successful: {successful_count} | Failed: {failed_count}")
-                    logger.info(f"Total reviews collected: {total_reviews}")
-                    logger.info(f"Time elapsed: {elapsed_time/60:.1f} minutes")
-                    logger.info("=" * 60)
-                
-            except Exception as e:
+        for prof_summary, review_count, error in results:
+            if error is not None:
                 failed_count += 1
-                error_msg = f"Error processing professor {prof_summary.professor_name}: {e}"
+                error_msg = f"Error processing professor {prof_summary.professor_name}: {error}"
                 errors.append(error_msg)
                 skipped_professors.append(prof_summary.professor_name)
                 logger.error(error_msg)
-                continue
+            elif review_count is not None:
+                successful_count += 1
+                total_reviews += review_count
+            else:
+                failed_count += 1
+                skipped_professors.append(prof_summary.professor_name)
         
         # Final summary
         total_time = time.time() - start_time
@@ -182,32 +368,78 @@ def run_scraping_workflow(args) -> tuple[List[Professor], List[str], List[str]]:
         logger.info(f"Total time: {total_time/60:.1f} minutes")
         logger.info(f"Average time per professor: {total_time/total_professors:.1f} seconds")
         logger.info("=" * 80)
+        logger.debug(f"Cleaner cache statistics: {DataCleaner.cache_info()}")
         
     finally:
         # Clean up WebDriver
-        logger.info("Closing WebDriver...")
-        webdriver_manager.quit_driver()
+        if webdriver_manager is not None:
+            logger.info("Closing WebDriver...")
+            webdriver_manager.quit_driver()
     
-    return professors, errors, skipped_professors
+    return successful_count, errors, skipped_professors
 
 
-def save_professors_to_json(professors: List[Professor], output_file: str):
+def validate_ndjson(ndjson_file: str) -> List[str]:
     """
-    Save professor data to JSON file using JSONWriter.
+    Validate every streamed professor record in a single pass.
     
     Args:
-        professors: List of Professor objects
+        ndjson_file: Path to NDJSON file written by the scraping workflow
+        
+    Returns:
+        List of validation problems (empty if all records are valid)
+    """
+    with open(ndjson_file, 'rb') as f:
+        return validate_professor_records(orjson.loads(line) for line in f if line.strip())
+
+
+def iter_professors(ndjson_file: str) -> Iterator[Professor]:
+    """
+    Stream Professor objects back from an NDJSON file one record at a time.
+    
+    Args:
+        ndjson_file: Path to NDJSON file written by the scraping workflow
+        
+    Yields:
+        Professor objects
+    """
+    with open(ndjson_file, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield Professor.from_dict(orjson.loads(line))
+
+
+def save_professors_to_json(ndjson_file: str, output_file: str, pretty: bool = False):
+    """
+    Rewrite the streamed NDJSON records as a single JSON array file.
+    
+    Records are copied line by line, so the full dataset is never held in memory.
+    The output file is replaced atomically once the array is complete.
+    
+    Args:
+        ndjson_file: Path to NDJSON file written by the scraping workflow
         output_file: Output file path
+        pretty: Re-encode each record with indentation
     """
     logger = logging.getLogger(__name__)
     
     try:
-        # Use JSONWriter to handle serialization, validation, and writing
-        json_writer = JSONWriter()
-        success = json_writer.save_professors(professors, output_file)
+        count = 0
+        with open(ndjson_file, 'rb') as src, atomic_open(output_file) as dst:
+            dst.write(b'[\n')
+            for line in src:
+                line = line.strip()
+                if not line:
+                    continue
+                if count:
+                    dst.write(b',\n')
+                if pretty:
+                    line = orjson.dumps(orjson.loads(line), option=orjson.OPT_INDENT_2)
+                dst.write(line)
+                count += 1
+            dst.write(b'\n]\n')
         
-        if not success:
-            raise Exception("Failed to save professors to JSON")
+        logger.info(f"Successfully saved {count} professors to {output_file}")
         
     except Exception as e:
         logger.error(f"Error saving to JSON: {e}")
@@ -225,26 +457,35 @@ def main():
     logger.info("Starting RateMyProfessor scraper for USF")
     logger.info("=" * 80)
     logger.info(f"Configuration: headless={args.headless}, output={args.output}, "
-                f"delay={args.delay}, max_professors={args.max_professors}")
+                f"delay={args.delay}, max_professors={args.max_professors}, "
+                f"concurrency={args.concurrency}, pretty={args.pretty}, use_browser={args.use_browser}")
     
     try:
         # Run the main scraping workflow
-        professors, errors, skipped_professors = run_scraping_workflow(args)
+        scraped_count, errors, skipped_professors = run_scraping_workflow(args)
+        ndjson_file = args.output + ".ndjson"
         
         # Save results to JSON and generate summary report
-        if professors:
-            save_professors_to_json(professors, args.output)
+        if scraped_count:
+            # Validate all scraped records in one pass after streaming
+            for problem in validate_ndjson(ndjson_file):
+                logger.warning(f"Invalid professor record: {problem}")
+                errors.append(f"Invalid professor record: {problem}")
+            
+            if not args.ndjson_only:
+                save_professors_to_json(ndjson_file, args.output, pretty=args.pretty)
             
             # Generate and log summary report
-            json_writer = JSONWriter()
-            summary = json_writer.generate_summary_report(professors, errors, skipped_professors)
+            json_writer = JSONWriter(pretty=args.pretty)
+            summary = json_writer.generate_summary_report(iter_professors(ndjson_file),
+                                                          errors, skipped_professors)
             json_writer.log_summary_report(summary)
             json_writer.save_summary_report(summary, "scraping_summary.json")
             
             logger.info("=" * 80)
-            logger.info(f"Scraping complete! Collected {len(professors)} professors")
-            logger.info(f"Total reviews: {sum(len(p.reviews) for p in professors)}")
-            logger.info(f"Output saved to: {args.output}")
+            logger.info(f"Scraping complete! Collected {scraped_count} professors")
+            logger.info(f"Total reviews: {summary['total_reviews_collected']}")
+            logger.info(f"Output saved to: {ndjson_file if args.ndjson_only else args.output}")
             logger.info(f"Summary report saved to: scraping_summary.json")
             logger.info("=" * 80)
         else:
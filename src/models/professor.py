@@ -1,10 +1,11 @@
 """Professor data models."""
 
+import sys
 from dataclasses import dataclass, field
 from typing import Optional, Dict, List
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProfessorSummary:
     """Summary data from main professor listing page."""
     
@@ -17,6 +18,11 @@ class ProfessorSummary:
     would_take_again_pct: Optional[int]
     professor_page_url: str
     
+    def __post_init__(self):
+        """Intern fields shared by many professors so each value is stored once."""
+        object.__setattr__(self, 'department', sys.intern(self.department))
+        object.__setattr__(self, 'university', sys.intern(self.university))
+    
     def validate(self) -> None:
         """Validate required fields are present and valid."""
         if not self.professor_name or not self.professor_name.strip():
@@ -48,7 +54,7 @@ class ProfessorSummary:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Professor:
     """Complete professor data including metadata and reviews."""
     
@@ -61,6 +67,11 @@ class Professor:
     tags: List[str] = field(default_factory=list)
     reviews: List['Review'] = field(default_factory=list)
     
+    def __post_init__(self):
+        """Intern fields shared by many professors so each value is stored once."""
+        object.__setattr__(self, 'department', sys.intern(self.department))
+        object.__setattr__(self, 'tags', [sys.intern(tag) for tag in self.tags])
+    
     def validate(self) -> None:
         """Validate required fields are present and valid."""
         if not self.professor_name or not self.professor_name.strip():
@@ -86,3 +97,19 @@ class Professor:
             'tags': self.tags,
             'reviews': [review.to_dict() for review in self.reviews]
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Professor':
+        """Create a Professor from a dictionary produced by to_dict()."""
+        from .review import Review
+        
+        return cls(
+            professor_name=data['professor_name'],
+            department=data['department'],
+            overall_quality=data['overall_quality'],
+            difficulty_level=data['difficulty_level'],
+            would_take_again=data.get('would_take_again'),
+            rating_distribution=data.get('rating_distribution', {}),
+            tags=data.get('tags', []),
+            reviews=[Review.from_dict(review) for review in data.get('reviews', [])]
+        )
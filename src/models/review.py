@@ -1,10 +1,11 @@
 """Review data model."""
 
+import sys
 from dataclasses import dataclass, field
 from typing import List, Dict
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Review:
     """Individual review data from professor page."""
     
@@ -21,6 +22,12 @@ class Review:
     helpful_upvotes: int = 0
     helpful_downvotes: int = 0
     
+    def __post_init__(self):
+        """Intern the course code and enum-like fields repeated across reviews."""
+        for name in ('course_code', 'attendance', 'grade', 'textbook_used'):
+            object.__setattr__(self, name, sys.intern(getattr(self, name)))
+        object.__setattr__(self, 'tags', [sys.intern(tag) for tag in self.tags])
+    
     def validate(self) -> None:
         """Validate required fields are present and valid."""
         if not self.course_code or not self.course_code.strip():
@@ -50,3 +57,8 @@ class Review:
             'helpful_upvotes': self.helpful_upvotes,
             'helpful_downvotes': self.helpful_downvotes
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Review':
+        """Create a Review from a dictionary produced by to_dict()."""
+        return cls(**data)
@@ -1,7 +1,19 @@
 """Scrapers for RateMyProfessor data extraction."""
 
-from .list_scraper import ProfessorListScraper
-from .detail_scraper import ProfessorDetailScraper
-from .review_scraper import ReviewScraper
+import importlib
 
 __all__ = ['ProfessorListScraper', 'ProfessorDetailScraper', 'ReviewScraper']
+
+# The browser scrapers pull in Selenium, so they are imported on first access;
+# importing src.scrapers.graphql_client alone stays cheap
+_LAZY_EXPORTS = {
+    'ProfessorListScraper': '.list_scraper',
+    'ProfessorDetailScraper': '.detail_scraper',
+    'ReviewScraper': '.review_scraper',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,49 @@
+"""Asynchronous professor detail scraper using direct HTTP requests."""
+
+import logging
+from typing import Optional
+
+import httpx
+
+from ..models.professor import Professor
+from .page_data import extract_teacher_data, build_professor
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9"
+}
+
+
+async def fetch_professor(session: httpx.AsyncClient, url: str) -> Optional[Professor]:
+    """
+    Fetch a professor page over HTTP and parse its embedded page data.
+
+    Args:
+        session: Shared HTTP client
+        url: URL of the professor's detail page
+
+    Returns:
+        Professor object, or None if the page has no embedded data
+        (e.g. it requires JavaScript execution)
+
+    Raises:
+        httpx.HTTPError: If the request fails
+    """
+    logger.debug(f"Fetching professor page: {url}")
+
+    response = await session.get(url, headers=DEFAULT_HEADERS)
+    response.raise_for_status()
+    html = response.text
+
+    teacher = extract_teacher_data(html)
+    if teacher is None:
+        logger.warning(f"No embedded page data found at {url}")
+        return None
+
+    professor = build_professor(teacher)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Parsed professor {professor.professor_name} with {len(professor.reviews)} reviews")
+    return professor
@@ -1,24 +1,104 @@
 """Professor detail page scraper for RateMyProfessor."""
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from typing import Dict, List, Optional
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
+from dataclasses import replace
+from typing import TYPE_CHECKING, Dict, List, Optional
 import logging
-import time
+import re
+
+import lxml.html
+from lxml import etree
 
 from ..models.professor import Professor
 from ..utils.cleaner import DataCleaner
 from ..utils.error_handler import ErrorHandler
-from .review_scraper import ReviewScraper
+from .page_data import extract_teacher_data, build_professor, rating_distribution_from_reviews
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+    from .review_scraper import ReviewScraper
 
 logger = logging.getLogger(__name__)
 
+_FIRST_INT_RE = re.compile(r'(\d+)')
+
+_RATING_CATEGORIES = [(category, category.lower()) for category in ("Awesome", "Great", "Good", "OK", "Awful")]
+
+# Number element of the feedback section whose text mentions a label,
+# matched case-insensitively
+FEEDBACK_NUMBER_XPATH = (
+    "//div[contains(@class, 'FeedbackItem')]"
+    "[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{label}')]"
+    "//div[contains(@class, 'FeedbackNumber')]"
+)
+
+DIFFICULTY_XPATH = etree.XPath(FEEDBACK_NUMBER_XPATH.format(label='difficulty'))
+
+WOULD_TAKE_AGAIN_XPATH = etree.XPath(FEEDBACK_NUMBER_XPATH.format(label='would take again'))
+
+# Selector alternatives for each fallback field, tried as one XPath union
+# (matches come back in document order)
+NAME_SELECTORS = (
+    "//div[contains(@class, 'NameTitle__Name')]",
+    "//div[contains(@class, 'TeacherInfo__Name')]",
+    "//h1[contains(@class, 'NameTitle')]"
+)
+
+DEPARTMENT_SELECTORS = (
+    "//div[contains(@class, 'NameTitle__Title')]//a",
+    "//a[contains(@class, 'TeacherDepartment')]",
+    "//div[contains(@class, 'Department')]"
+)
+
+QUALITY_SELECTORS = (
+    "//div[contains(@class, 'RatingValue__Numerator')]",
+    "//div[contains(@class, 'TeacherRating__Rating')]",
+    "//div[contains(@class, 'Quality')]//div[contains(@class, 'RatingValue')]"
+)
+
+DIFFICULTY_SELECTORS = (
+    "//div[contains(@class, 'FeedbackItem__FeedbackNumber') and contains(@class, 'Difficulty')]",
+    "//div[contains(@class, 'Difficulty')]//div[contains(@class, 'FeedbackNumber')]"
+)
+
+DISTRIBUTION_SELECTORS = (
+    "//div[contains(@class, 'RatingDistribution')]",
+    "//div[contains(@class, 'Histogram')]",
+    "//div[contains(@class, 'RatingBreakdown')]"
+)
+
+# Tried one at a time: the last selector is a broad catch-all that would
+# pick up unrelated text if merged with the others
+TAG_SELECTORS = (
+    "//span[contains(@class, 'Tag-')]",
+    "//div[contains(@class, 'TeacherTag')]",
+    "//span[contains(@class, 'TeacherTags')]",
+    "//div[contains(@class, 'Tag')]//span"
+)
+
+NAME_XPATH = etree.XPath(" | ".join(NAME_SELECTORS))
+DEPARTMENT_XPATH = etree.XPath(" | ".join(DEPARTMENT_SELECTORS))
+QUALITY_XPATH = etree.XPath(" | ".join(QUALITY_SELECTORS))
+DIFFICULTY_FALLBACK_XPATH = etree.XPath(" | ".join(DIFFICULTY_SELECTORS))
+DISTRIBUTION_XPATH = etree.XPath(" | ".join(DISTRIBUTION_SELECTORS))
+DISTRIBUTION_ROW_XPATH = etree.XPath(".//div[contains(@class, 'Rating')]")
+TAG_XPATHS = tuple(etree.XPath(selector) for selector in TAG_SELECTORS)
+
+PROFESSOR_HEADER_SELECTOR = "div[class*='NameTitle__Name']"
+
+# Routes the already booted single-page app to another professor without a
+# full page load, so the script bundle, fonts and ads are not loaded again
+SOFT_NAVIGATION_JS = """
+history.pushState({}, '', arguments[0]);
+window.dispatchEvent(new PopStateEvent('popstate', {state: {}}));
+"""
+
 
 class ProfessorDetailScraper:
     """Scraper for extracting detailed professor information from individual professor pages."""
     
-    def __init__(self, driver: webdriver.Chrome):
+    def __init__(self, driver: 'webdriver.Chrome'):
         """
         Initialize the ProfessorDetailScraper.
         
@@ -28,7 +108,24 @@ class ProfessorDetailScraper:
         self.driver = driver
         self.cleaner = DataCleaner()
         self.error_handler = ErrorHandler(max_retries=3)
-        self.review_scraper = ReviewScraper(driver)
+        self._review_scraper = None
+        
+        # Cleared the first time in-app navigation fails to render a new page
+        self._soft_navigation = True
+        
+        # Fallback fields are read from one parse of the page source rather
+        # than one WebDriver round trip per selector
+        self._parser = lxml.html.HTMLParser(recover=True)
+        self._tree = None
+    
+    @property
+    def review_scraper(self) -> 'ReviewScraper':
+        """Review scraper for the current page, created on first use."""
+        if self._review_scraper is None:
+            # Deferred so pages served from embedded data never load it
+            from .review_scraper import ReviewScraper
+            self._review_scraper = ReviewScraper(self.driver)
+        return self._review_scraper
     
     def scrape_professor(self, url: str) -> Optional[Professor]:
         """
@@ -43,14 +140,40 @@ class ProfessorDetailScraper:
         try:
             logger.info(f"Scraping professor page: {url}")
             
+            # Imported on first scrape; the rest of Selenium's WebDriver
+            # package is only needed once a browser is running
+            from selenium.webdriver.support import expected_conditions as EC
+            from selenium.webdriver.support.ui import WebDriverWait
+            
             # Navigate to professor page with retry logic
             def _navigate():
                 self.driver.get(url)
-                time.sleep(2)  # Wait for page to load
-            
-            self.error_handler.retry_with_backoff(_navigate)
+                try:
+                    # Continue as soon as the professor header is rendered
+                    WebDriverWait(self.driver, 10, poll_frequency=0.1).until(EC.presence_of_element_located(
+                        (By.CSS_SELECTOR, PROFESSOR_HEADER_SELECTOR)
+                    ))
+                except TimeoutException:
+                    logger.warning(f"Professor header did not appear at {url}")
+            
+            soft_navigated = self._soft_navigate(url)
+            if not soft_navigated:
+                self.error_handler.retry_with_backoff(_navigate)
+            self._tree = None
+            
+            # Parse the data embedded in the page in a single pass instead of
+            # one WebDriver round trip per field. The embedded data describes
+            # the page's initial load, so it is stale after in-app navigation.
+            page_source = self.driver.page_source
+            teacher = None if soft_navigated else extract_teacher_data(page_source)
+            if teacher is not None:
+                return self._professor_from_page_data(teacher)
+            
+            logger.info("No embedded page data found, extracting fields from the DOM")
+            
+            # Every field below is read from this one parse of the rendered page
+            self._tree = lxml.html.fromstring(page_source, parser=self._parser)
             
-            # Extract metadata with error handling
             professor_name = self._extract_professor_name()
             department = self._extract_department()
             overall_quality = self._extract_overall_quality()
@@ -68,6 +191,10 @@ class ProfessorDetailScraper:
             self.review_scraper.load_all_reviews()
             reviews = self.review_scraper.extract_reviews()
             
+            # Count the loaded reviews if the page had no distribution section
+            if not any(rating_distribution.values()):
+                rating_distribution = rating_distribution_from_reviews(reviews)
+            
             # Create Professor object with metadata and reviews
             professor = Professor(
                 professor_name=professor_name,
@@ -88,221 +215,199 @@ class ProfessorDetailScraper:
             logger.warning(f"Skipping professor at {url} due to errors")
             return None
 
-    def _extract_professor_name(self, retry: bool = True) -> str:
+    def _soft_navigate(self, url: str) -> bool:
         """
-        Extract professor name from detail page with retry logic.
+        Open a professor page through the site's client-side router.
+        
+        Only attempted while a professor page is already loaded. If the new
+        professor's header does not render, in-app navigation is disabled for
+        the rest of this scraper's life and pages are loaded normally.
         
         Args:
-            retry: Whether to retry once if extraction fails
+            url: URL of the professor's detail page
             
+        Returns:
+            True if the new page rendered, False if a full page load is needed
+        """
+        if not self._soft_navigation:
+            return False
+        
+        from selenium.webdriver.support.ui import WebDriverWait
+        
+        try:
+            headers = self.driver.find_elements(By.CSS_SELECTOR, PROFESSOR_HEADER_SELECTOR)
+            if not headers:
+                return False
+            previous_name = headers[0].get_property('textContent')
+            
+            self.driver.execute_script(SOFT_NAVIGATION_JS, url)
+            
+            # The router re-renders the header in place, so wait for its text to change
+            WebDriverWait(self.driver, 5, poll_frequency=0.1,
+                          ignored_exceptions=(StaleElementReferenceException,)).until(lambda driver: any(
+                header.get_property('textContent') != previous_name
+                for header in driver.find_elements(By.CSS_SELECTOR, PROFESSOR_HEADER_SELECTOR)
+            ))
+            logger.debug(f"Navigated in-app to {url}")
+            return True
+            
+        except Exception as e:
+            logger.info(f"In-app navigation did not render {url}, using full page loads: {e}")
+            self._soft_navigation = False
+            return False
+    
+    def _professor_from_page_data(self, teacher: Dict) -> Professor:
+        """
+        Build a Professor from the page's embedded teacher record.
+        
+        The page only embeds the first batch of ratings, so reviews are loaded
+        from the DOM when the record holds fewer ratings than the professor has.
+        
+        Args:
+            teacher: Teacher record from the embedded page data
+            
+        Returns:
+            Professor object with metadata and reviews
+        """
+        professor = build_professor(teacher)
+        
+        num_ratings = teacher.get('numRatings') or 0
+        if len(professor.reviews) < num_ratings:
+            logger.info(f"Page embeds {len(professor.reviews)} of {num_ratings} reviews, loading the rest...")
+            self.review_scraper.load_all_reviews()
+            professor = replace(professor, reviews=self.review_scraper.extract_reviews())
+        
+        logger.info(f"Successfully scraped professor: {professor.professor_name} "
+                    f"with {len(professor.reviews)} reviews")
+        return professor
+    
+    def _page_tree(self):
+        """
+        Get the parsed page source, parsing the current page on first use.
+        
+        Returns:
+            lxml root element of the page
+        """
+        if self._tree is None:
+            self._tree = lxml.html.fromstring(self.driver.page_source, parser=self._parser)
+        return self._tree
+    
+    def _extract_professor_name(self) -> str:
+        """
+        Extract professor name from detail page.
+        
         Returns:
             Professor name string
         """
         try:
-            # Try multiple selectors for professor name
-            selectors = [
-                "div[class*='NameTitle__Name']",
-                "div[class*='TeacherInfo__Name']",
-                "h1[class*='NameTitle']"
-            ]
-            
-            for selector in selectors:
-                try:
-                    element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    name = self.cleaner.clean_text(element.text)
-                    if name:
-                        logger.debug(f"Extracted professor name: {name}")
-                        return name
-                except NoSuchElementException:
-                    continue
+            # One union query returns every match in document order
+            for element in NAME_XPATH(self._page_tree()):
+                name = self.cleaner.clean_text(element.text_content())
+                if name:
+                    logger.debug(f"Extracted professor name: {name}")
+                    return name
             
             raise NoSuchElementException("Professor name not found with any selector")
             
         except Exception as e:
-            if retry:
-                logger.warning(f"First attempt to extract professor name failed, retrying: {e}")
-                time.sleep(2)
-                return self._extract_professor_name(retry=False)
-            else:
-                logger.error(f"Failed to extract professor name: {e}")
-                return "Unknown"
+            logger.error(f"Failed to extract professor name: {e}")
+            return "Unknown"
     
-    def _extract_department(self, retry: bool = True) -> str:
+    def _extract_department(self) -> str:
         """
-        Extract department from detail page with retry logic.
+        Extract department from detail page.
         
-        Args:
-            retry: Whether to retry once if extraction fails
-            
         Returns:
             Department string
         """
         try:
-            # Try multiple selectors for department
-            selectors = [
-                "div[class*='NameTitle__Title'] a",
-                "a[class*='TeacherDepartment']",
-                "div[class*='Department']"
-            ]
-            
-            for selector in selectors:
-                try:
-                    element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    department = self.cleaner.clean_text(element.text)
-                    if department:
-                        logger.debug(f"Extracted department: {department}")
-                        return department
-                except NoSuchElementException:
-                    continue
+            # One union query returns every match in document order
+            for element in DEPARTMENT_XPATH(self._page_tree()):
+                department = self.cleaner.clean_text(element.text_content())
+                if department:
+                    logger.debug(f"Extracted department: {department}")
+                    return department
             
             raise NoSuchElementException("Department not found with any selector")
             
         except Exception as e:
-            if retry:
-                logger.warning(f"First attempt to extract department failed, retrying: {e}")
-                time.sleep(2)
-                return self._extract_department(retry=False)
-            else:
-                logger.error(f"Failed to extract department: {e}")
-                return "Unknown"
+            logger.error(f"Failed to extract department: {e}")
+            return "Unknown"
     
-    def _extract_overall_quality(self, retry: bool = True) -> float:
+    def _extract_overall_quality(self) -> float:
         """
-        Extract overall quality rating with retry logic.
+        Extract overall quality rating.
         
-        Args:
-            retry: Whether to retry once if extraction fails
-            
         Returns:
             Quality rating as float (0-5)
         """
         try:
-            # Try multiple selectors for quality rating
-            selectors = [
-                "div[class*='RatingValue__Numerator']",
-                "div[class*='TeacherRating__Rating']",
-                "div[class*='Quality'] div[class*='RatingValue']"
-            ]
-            
-            for selector in selectors:
-                try:
-                    element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    quality_text = element.text.strip()
-                    quality = self.cleaner.parse_number(quality_text)
-                    if quality is not None:
-                        logger.debug(f"Extracted overall quality: {quality}")
-                        return quality
-                except NoSuchElementException:
-                    continue
+            # One union query returns every match in document order
+            for element in QUALITY_XPATH(self._page_tree()):
+                quality_text = element.text_content().strip()
+                quality = self.cleaner.parse_number(quality_text)
+                if quality is not None:
+                    logger.debug(f"Extracted overall quality: {quality}")
+                    return quality
             
             raise NoSuchElementException("Overall quality not found with any selector")
             
         except Exception as e:
-            if retry:
-                logger.warning(f"First attempt to extract overall quality failed, retrying: {e}")
-                time.sleep(2)
-                return self._extract_overall_quality(retry=False)
-            else:
-                logger.error(f"Failed to extract overall quality: {e}")
-                return 0.0
+            logger.error(f"Failed to extract overall quality: {e}")
+            return 0.0
     
-    def _extract_difficulty_level(self, retry: bool = True) -> float:
+    def _extract_difficulty_level(self) -> float:
         """
-        Extract difficulty level with retry logic.
+        Extract difficulty level.
         
-        Args:
-            retry: Whether to retry once if extraction fails
-            
         Returns:
             Difficulty level as float (0-5)
         """
         try:
-            # Try multiple selectors for difficulty
-            selectors = [
-                "div[class*='FeedbackItem__FeedbackNumber'][class*='Difficulty']",
-                "div[class*='Difficulty'] div[class*='FeedbackNumber']"
-            ]
+            tree = self._page_tree()
             
-            # First try to find the difficulty section
-            difficulty_sections = self.driver.find_elements(By.CSS_SELECTOR, "div[class*='FeedbackItem']")
-            
-            for section in difficulty_sections:
-                try:
-                    # Check if this section contains "Level of Difficulty" or similar text
-                    section_text = section.text.lower()
-                    if 'difficulty' in section_text:
-                        # Extract the number from this section
-                        number_element = section.find_element(By.CSS_SELECTOR, "div[class*='FeedbackNumber']")
-                        difficulty_text = number_element.text.strip()
-                        difficulty = self.cleaner.parse_number(difficulty_text)
-                        if difficulty is not None:
-                            logger.debug(f"Extracted difficulty level: {difficulty}")
-                            return difficulty
-                except NoSuchElementException:
-                    continue
+            # First try the number in the "Level of Difficulty" section
+            for number_element in DIFFICULTY_XPATH(tree):
+                difficulty = self.cleaner.parse_number(number_element.text_content().strip())
+                if difficulty is not None:
+                    logger.debug(f"Extracted difficulty level: {difficulty}")
+                    return difficulty
             
             # Fallback to direct selectors
-            for selector in selectors:
-                try:
-                    element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    difficulty_text = element.text.strip()
-                    difficulty = self.cleaner.parse_number(difficulty_text)
-                    if difficulty is not None:
-                        logger.debug(f"Extracted difficulty level: {difficulty}")
-                        return difficulty
-                except NoSuchElementException:
-                    continue
+            for element in DIFFICULTY_FALLBACK_XPATH(tree):
+                difficulty_text = element.text_content().strip()
+                difficulty = self.cleaner.parse_number(difficulty_text)
+                if difficulty is not None:
+                    logger.debug(f"Extracted difficulty level: {difficulty}")
+                    return difficulty
             
             raise NoSuchElementException("Difficulty level not found with any selector")
             
         except Exception as e:
-            if retry:
-                logger.warning(f"First attempt to extract difficulty level failed, retrying: {e}")
-                time.sleep(2)
-                return self._extract_difficulty_level(retry=False)
-            else:
-                logger.error(f"Failed to extract difficulty level: {e}")
-                return 0.0
+            logger.error(f"Failed to extract difficulty level: {e}")
+            return 0.0
     
-    def _extract_would_take_again(self, retry: bool = True) -> Optional[int]:
+    def _extract_would_take_again(self) -> Optional[int]:
         """
-        Extract would take again percentage with retry logic.
+        Extract would take again percentage.
         
-        Args:
-            retry: Whether to retry once if extraction fails
-            
         Returns:
             Percentage as integer (0-100) or None if not available
         """
         try:
-            # Find the "Would Take Again" section
-            feedback_sections = self.driver.find_elements(By.CSS_SELECTOR, "div[class*='FeedbackItem']")
-            
-            for section in feedback_sections:
-                try:
-                    section_text = section.text.lower()
-                    if 'would take again' in section_text:
-                        # Extract the percentage from this section
-                        number_element = section.find_element(By.CSS_SELECTOR, "div[class*='FeedbackNumber']")
-                        percentage_text = number_element.text.strip()
-                        percentage = self.cleaner.parse_percentage(percentage_text)
-                        if percentage is not None:
-                            logger.debug(f"Extracted would take again: {percentage}%")
-                            return percentage
-                except NoSuchElementException:
-                    continue
+            # Find the number in the "Would Take Again" section
+            for number_element in WOULD_TAKE_AGAIN_XPATH(self._page_tree()):
+                percentage = self.cleaner.parse_percentage(number_element.text_content().strip())
+                if percentage is not None:
+                    logger.debug(f"Extracted would take again: {percentage}%")
+                    return percentage
             
             logger.debug("Would take again percentage not found")
             return None
             
         except Exception as e:
-            if retry:
-                logger.warning(f"First attempt to extract would take again failed, retrying: {e}")
-                time.sleep(2)
-                return self._extract_would_take_again(retry=False)
-            else:
-                logger.error(f"Failed to extract would take again: {e}")
-                return None
+            logger.error(f"Failed to extract would take again: {e}")
+            return None
 
     def extract_rating_distribution(self) -> Dict[str, int]:
         """
@@ -321,46 +426,17 @@ class ProfessorDetailScraper:
         
         try:
             # Try to find the rating distribution section
-            # Common selectors for rating distribution
-            selectors = [
-                "div[class*='RatingDistribution']",
-                "div[class*='Histogram']",
-                "div[class*='RatingBreakdown']"
-            ]
-            
-            distribution_section = None
-            for selector in selectors:
-                try:
-                    distribution_section = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    break
-                except NoSuchElementException:
-                    continue
-            
-            if not distribution_section:
+            sections = DISTRIBUTION_XPATH(self._page_tree())
+            if not sections:
                 logger.warning("Rating distribution section not found")
                 return distribution
             
             # Extract individual rating counts
             # Look for elements that contain rating labels and counts
-            rating_elements = distribution_section.find_elements(By.CSS_SELECTOR, "div[class*='Rating']")
-            
-            for element in rating_elements:
-                try:
-                    text = element.text.strip()
-                    
-                    # Check for each rating category
-                    for category in distribution.keys():
-                        if category.lower() in text.lower():
-                            # Extract the number from the text
-                            # Look for patterns like "Awesome 28" or "28 Awesome"
-                            numbers = [int(s) for s in text.split() if s.isdigit()]
-                            if numbers:
-                                distribution[category] = numbers[0]
-                                logger.debug(f"Found {category}: {numbers[0]}")
-                                break
-                except Exception as e:
-                    logger.debug(f"Error parsing rating element: {e}")
-                    continue
+            rating_elements = DISTRIBUTION_ROW_XPATH(sections[0])
+            distribution = self._parse_rating_distribution(
+                [element.text_content() for element in rating_elements]
+            )
             
             logger.info(f"Extracted rating distribution: {distribution}")
             return distribution
@@ -368,7 +444,60 @@ class ProfessorDetailScraper:
         except Exception as e:
             logger.error(f"Error extracting rating distribution: {e}")
             return distribution
+    
+    def _parse_rating_distribution(self, texts) -> Dict[str, int]:
+        """
+        Parse rating counts from the text of the distribution rows.
+        
+        Args:
+            texts: Text of each rating row, e.g. "Awesome 28"
+            
+        Returns:
+            Dictionary with rating categories as keys and counts as values
+        """
+        distribution = {
+            "Awesome": 0,
+            "Great": 0,
+            "Good": 0,
+            "OK": 0,
+            "Awful": 0
+        }
+        
+        for text in texts:
+            lowered = text.lower()
+            
+            # Check for each rating category
+            for category, category_lower in _RATING_CATEGORIES:
+                if category_lower in lowered:
+                    # Extract the first number from the text
+                    # Look for patterns like "Awesome 28" or "28 Awesome"
+                    match = _FIRST_INT_RE.search(text)
+                    if match:
+                        distribution[category] = int(match.group(1))
+                        logger.debug(f"Found {category}: {distribution[category]}")
+                        break
+        
+        return distribution
 
+    def _clean_tags(self, texts) -> List[str]:
+        """
+        Clean tag texts, dropping empty and duplicate tags.
+        
+        Args:
+            texts: Raw text of each tag element
+            
+        Returns:
+            List of tag strings in page order
+        """
+        tags = []
+        seen = set()
+        for text in texts:
+            tag_text = self.cleaner.clean_text(text)
+            if tag_text and tag_text not in seen:  # Avoid duplicates
+                seen.add(tag_text)
+                tags.append(tag_text)
+        return tags
+    
     def extract_tags(self) -> List[str]:
         """
         Extract all professor characteristic tags from the page.
@@ -379,37 +508,20 @@ class ProfessorDetailScraper:
         tags = []
         
         try:
-            # Try multiple selectors for tags
-            selectors = [
-                "span[class*='Tag-']",
-                "div[class*='TeacherTag']",
-                "span[class*='TeacherTags']",
-                "div[class*='Tag'] span"
-            ]
-            
+            # Tags from the first selector that matches
+            tree = self._page_tree()
             tag_elements = []
-            for selector in selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        tag_elements = elements
-                        break
-                except NoSuchElementException:
-                    continue
+            for xpath in TAG_XPATHS:
+                tag_elements = xpath(tree)
+                if tag_elements:
+                    break
             
             if not tag_elements:
                 logger.warning("No tag elements found")
                 return tags
             
             # Extract text from each tag element
-            for element in tag_elements:
-                try:
-                    tag_text = self.cleaner.clean_text(element.text)
-                    if tag_text and tag_text not in tags:  # Avoid duplicates
-                        tags.append(tag_text)
-                except Exception as e:
-                    logger.debug(f"Error extracting tag text: {e}")
-                    continue
+            tags = self._clean_tags(element.text_content() for element in tag_elements)
             
             logger.info(f"Extracted {len(tags)} tags: {tags}")
             return tags
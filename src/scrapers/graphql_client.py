@@ -0,0 +1,258 @@
+"""GraphQL client for fetching professor data directly from RateMyProfessor's API."""
+
+import base64
+import logging
+import re
+from typing import Any, AsyncIterator, Dict, Optional
+
+import httpx
+
+from ..models.professor import Professor, ProfessorSummary
+from .page_data import build_professor, build_summary
+
+logger = logging.getLogger(__name__)
+
+GRAPHQL_URL = "https://www.ratemyprofessors.com/graphql"
+
+RATINGS_PAGE_SIZE = 100
+
+TEACHERS_PAGE_SIZE = 100
+
+TEACHER_SEARCH_QUERY = """
+query TeacherSearchPaginationQuery($count: Int!, $cursor: String, $query: TeacherSearchQuery!) {
+  search: newSearch {
+    teachers(query: $query, first: $count, after: $cursor) {
+      edges {
+        node {
+          legacyId
+          firstName
+          lastName
+          department
+          avgRating
+          avgDifficulty
+          wouldTakeAgainPercent
+          numRatings
+          school { name }
+        }
+      }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+"""
+
+TEACHER_QUERY = """
+query TeacherRatingsPageQuery($id: ID!, $count: Int!, $cursor: String) {
+  node(id: $id) {
+    ... on Teacher {
+      id
+      legacyId
+      firstName
+      lastName
+      department
+      avgRating
+      avgDifficulty
+      wouldTakeAgainPercent
+      numRatings
+      ratingsDistribution { r1 r2 r3 r4 r5 total }
+      teacherRatingTags { tagName tagCount }
+      ratings(first: $count, after: $cursor) {
+        edges {
+          node {
+            class
+            isForCredit
+            attendanceMandatory
+            grade
+            textbookUse
+            qualityRating
+            difficultyRatingRounded
+            comment
+            ratingTags
+            date
+            thumbsUpTotal
+            thumbsDownTotal
+          }
+        }
+        pageInfo { hasNextPage endCursor }
+      }
+    }
+  }
+}
+"""
+
+_LEGACY_ID_RE = re.compile(r'/professor/(?:show\.jsp\?tid=)?(\d+)')
+
+_SCHOOL_ID_RE = re.compile(r'/search/professors/(\d+)')
+
+
+def teacher_node_id(url: str) -> Optional[str]:
+    """
+    Get the GraphQL node ID for a professor page URL.
+
+    Professor URLs carry the legacy numeric ID; the GraphQL node ID is
+    base64("Teacher-<legacy id>"). URLs that already contain a node ID are
+    validated by decoding it.
+
+    Args:
+        url: URL of the professor's detail page
+
+    Returns:
+        Base64 node ID, or None if the URL has no professor ID
+    """
+    match = _LEGACY_ID_RE.search(url or "")
+    if match:
+        return base64.b64encode(f"Teacher-{match.group(1)}".encode()).decode()
+
+    candidate = (url or "").rstrip("/").rsplit("/", 1)[-1]
+    try:
+        if base64.b64decode(candidate, validate=True).startswith(b"Teacher-"):
+            return candidate
+    except ValueError:
+        pass
+    return None
+
+
+def create_client() -> httpx.AsyncClient:
+    """
+    Create the keep-alive HTTP/2 connection pool used for a scraping run.
+
+    The caller owns the client and should close it, e.g. with
+    ``async with create_client() as client:``.
+
+    Returns:
+        New httpx.AsyncClient configured for the RateMyProfessor API
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=30.0,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=20, keepalive_expiry=120),
+        headers={
+            "Authorization": "Basic dGVzdDp0ZXN0",
+            "Connection": "keep-alive",
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+        }
+    )
+
+
+def school_node_id(url: str) -> Optional[str]:
+    """
+    Get the GraphQL node ID for a school's professor listing URL.
+
+    Args:
+        url: URL of the listing page, e.g. .../search/professors/1262?q=*
+
+    Returns:
+        Base64 node ID ("School-<id>"), or None if the URL has no school ID
+    """
+    match = _SCHOOL_ID_RE.search(url or "")
+    if not match:
+        return None
+    return base64.b64encode(f"School-{match.group(1)}".encode()).decode()
+
+
+async def _post(client: httpx.AsyncClient, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+    """POST a GraphQL query and return its data object."""
+    response = await client.post(GRAPHQL_URL, json={"query": query, "variables": variables})
+    response.raise_for_status()
+
+    payload = response.json()
+    if payload.get("errors"):
+        logger.warning(f"GraphQL errors for {variables}: {payload['errors']}")
+
+    return payload.get("data") or {}
+
+
+async def _post_query(client: httpx.AsyncClient, variables: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """POST the teacher query and return the teacher node, or None if it does not exist."""
+    return (await _post(client, TEACHER_QUERY, variables)).get("node")
+
+
+async def iter_professor_summaries(client: httpx.AsyncClient, listing_url: str,
+                                   max_items: Optional[int] = None) -> AsyncIterator[ProfessorSummary]:
+    """
+    Page through a school's professors with the teacher search API.
+
+    Args:
+        client: HTTP client to send the requests with
+        listing_url: URL of the school's professor listing page
+        max_items: Stop after yielding this many summaries (default: all)
+
+    Yields:
+        ProfessorSummary objects in search order
+
+    Raises:
+        ValueError: If the URL has no school ID
+        httpx.HTTPError: If a request fails
+    """
+    school_id = school_node_id(listing_url)
+    if school_id is None:
+        raise ValueError(f"Could not determine school ID from URL: {listing_url}")
+
+    variables = {
+        "count": TEACHERS_PAGE_SIZE,
+        "cursor": None,
+        "query": {"text": "", "schoolID": school_id, "fallback": True}
+    }
+    yielded = 0
+    while True:
+        data = await _post(client, TEACHER_SEARCH_QUERY, variables)
+        teachers = (data.get("search") or {}).get("teachers") or {}
+
+        for edge in teachers.get("edges") or []:
+            node = (edge or {}).get("node")
+            if not node or node.get("legacyId") is None:
+                continue
+            yield build_summary(node)
+            yielded += 1
+            if max_items is not None and yielded >= max_items:
+                return
+
+        page_info = teachers.get("pageInfo") or {}
+        if not (page_info.get("hasNextPage") and page_info.get("endCursor")):
+            break
+        variables["cursor"] = page_info["endCursor"]
+
+    logger.info(f"Finished listing {yielded} professors")
+
+
+async def query_professor(client: httpx.AsyncClient, url: str) -> Optional[Professor]:
+    """
+    Fetch a professor and all of their ratings through the GraphQL API.
+
+    Args:
+        client: HTTP client to send the requests with
+        url: URL of the professor's detail page
+
+    Returns:
+        Professor object, or None if the professor could not be found
+
+    Raises:
+        httpx.HTTPError: If a request fails
+    """
+    node_id = teacher_node_id(url)
+    if node_id is None:
+        logger.warning(f"Could not determine professor ID from URL: {url}")
+        return None
+
+    variables = {"id": node_id, "count": RATINGS_PAGE_SIZE, "cursor": None}
+    teacher = await _post_query(client, variables)
+    if not teacher:
+        return None
+
+    ratings = teacher.get("ratings") or {}
+    edges = list(ratings.get("edges") or [])
+    page_info = ratings.get("pageInfo") or {}
+
+    # Follow the ratings cursor until every review has been fetched
+    while page_info.get("hasNextPage") and page_info.get("endCursor"):
+        variables["cursor"] = page_info["endCursor"]
+        page = await _post_query(client, variables)
+        page_ratings = (page or {}).get("ratings") or {}
+        edges.extend(page_ratings.get("edges") or [])
+        page_info = page_ratings.get("pageInfo") or {}
+
+    teacher["ratings"] = {"edges": edges}
+    professor = build_professor(teacher)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Fetched professor {professor.professor_name} with {len(professor.reviews)} reviews")
+    return professor
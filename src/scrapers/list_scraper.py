@@ -1,19 +1,60 @@
 """Professor List Scraper for RateMyProfessor main listing page."""
 
+import asyncio
 import logging
-import time
-import json
-from typing import List
+import re
+from typing import AsyncIterator, List, Optional, Tuple
+from urllib.parse import urljoin
+
+import lxml.html
+import orjson
+from lxml import etree
 from selenium import webdriver
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
 from src.models import ProfessorSummary
 from src.utils.cleaner import DataCleaner
+from src.utils.atomic_file import atomic_open
 from src.utils.error_handler import ErrorHandler
+from src.utils.validation import validate_summaries
 
 logger = logging.getLogger(__name__)
 
+# Leading count of a "28 ratings" label, allowing thousands separators
+_LEADING_COUNT_RE = re.compile(r'\s*([\d,]+)')
+
+# Clicks "Show More" from inside the page until the listing is exhausted, enough
+# cards are loaded or the time budget runs out. Each click waits only for the
+# card count to grow, with no scrolling or fixed sleeps and no WebDriver round
+# trip per click. Resolves to [clicks, cards, finished].
+LOAD_MORE_CARDS_JS = """
+const [cardSelector, maxCards, budgetMs, batchTimeoutMs, done] = arguments;
+const deadline = Date.now() + budgetMs;
+const count = () => document.querySelectorAll(cardSelector).length;
+const showMore = () => Array.from(document.querySelectorAll("button"))
+    .find(button => button.textContent.includes("Show More"));
+let clicks = 0;
+const step = () => {
+    const before = count();
+    const button = showMore();
+    if (!button || (maxCards !== null && before >= maxCards)) return done([clicks, before, true]);
+    if (Date.now() >= deadline) return done([clicks, before, false]);
+    button.click();
+    clicks++;
+    const started = Date.now();
+    const poll = () => {
+        if (count() > before) step();
+        else if (Date.now() - started >= batchTimeoutMs) done([clicks, before, true]);
+        else setTimeout(poll, 50);
+    };
+    poll();
+};
+step();
+"""
+
 
 class ProfessorListScraper:
     """Scrapes professor summary data from the main RateMyProfessor listing page."""
@@ -31,6 +72,18 @@ class ProfessorListScraper:
         self.cleaner = DataCleaner()
         self.error_handler = ErrorHandler(max_retries=3)
         
+        # Cards are parsed from the page source with lxml; the parser and
+        # XPath expressions are built once and reused for every page
+        self._parser = lxml.html.HTMLParser(recover=True)
+        self._card_xpath = etree.XPath("//a[starts-with(@class, 'TeacherCard__StyledTeacherCard')]")
+        self._name_xpath = etree.XPath(".//div[contains(@class, 'CardName')]")
+        self._school_xpath = etree.XPath(".//div[contains(@class, 'CardSchool')]")
+        self._quality_xpath = etree.XPath(".//div[contains(@class, 'CardNumRating')]")
+        self._num_ratings_xpath = etree.XPath(
+            ".//div[contains(@class, 'CardNumRating')]/following-sibling::*[1][self::div]"
+        )
+        self._feedback_xpath = etree.XPath(".//div[contains(@class, 'CardFeedback')]")
+        
         logger.info(f"ProfessorListScraper initialized with URL: {base_url}")
     
     def navigate_to_listing(self):
@@ -38,7 +91,13 @@ class ProfessorListScraper:
         def _navigate():
             logger.info(f"Navigating to {self.base_url}")
             self.driver.get(self.base_url)
-            time.sleep(2)  # Wait for initial page load
+            try:
+                # Continue as soon as the first professor cards are rendered
+                WebDriverWait(self.driver, 10, poll_frequency=0.1).until(EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, "a[class^='TeacherCard__StyledTeacherCard']")
+                ))
+            except TimeoutException:
+                logger.warning("No professor cards appeared on the listing page")
             logger.info("Successfully navigated to listing page")
         
         try:
@@ -47,69 +106,58 @@ class ProfessorListScraper:
             self.error_handler.log_error(e, "navigating to listing page")
             raise
 
-    def _click_show_more(self) -> bool:
+    def _load_more_cards(self, max_items: Optional[int] = None,
+                         budget: float = 15.0) -> Tuple[int, int, bool]:
         """
-        Find and click the "Show More" button using XPath with error handling.
+        Click "Show More" repeatedly inside the page for up to budget seconds.
         
+        Args:
+            max_items: Stop once this many cards are on the page (default: no limit)
+            budget: Seconds to keep clicking before returning control; kept well
+                under the driver's script timeout
+            
         Returns:
-            True if button was found and clicked, False otherwise
+            Tuple of (clicks made, cards on the page, whether loading is finished)
         """
-        try:
-            # Use XPath to find the "Show More" button
-            show_more_button = self.driver.find_element(
-                By.XPATH, 
-                "//button[contains(., 'Show More')]"
-            )
-            
-            # Scroll to button and click
-            self.driver.execute_script(
-                "arguments[0].scrollIntoView({block: 'center'});", 
-                show_more_button
-            )
-            time.sleep(0.5)  # Brief pause after scroll
-            
-            show_more_button.click()
-            logger.debug("Clicked 'Show More' button")
-            
-            # Add delay to handle rate limiting
-            time.sleep(1.5)
-            return True
-            
-        except NoSuchElementException:
-            logger.info("'Show More' button not found - all professors loaded")
-            return False
-        except Exception as e:
-            logger.warning(f"Error clicking 'Show More' button: {e}")
-            # Wait before retrying to handle rate limiting
-            time.sleep(2)
-            return False
+        clicks, cards, finished = self.driver.execute_async_script(
+            LOAD_MORE_CARDS_JS,
+            "a[class^='TeacherCard__StyledTeacherCard']",
+            max_items,
+            int(budget * 1000),
+            10000
+        )
+        return clicks, cards, finished
     
-    def load_all_professors(self) -> None:
+    def load_all_professors(self, max_items: Optional[int] = None) -> None:
         """
-        Click "Show More" button repeatedly until all professors are loaded.
-        Adds delay between clicks to avoid rate limiting.
+        Click "Show More" until all professors are loaded.
+        
+        The clicks are driven by LOAD_MORE_CARDS_JS in the browser, each one
+        waiting only for its batch of cards; control returns to Python every
+        few seconds to log progress.
+        
+        Args:
+            max_items: Stop loading once this many cards are on the page (default: load all)
         """
         logger.info("Starting to load all professors...")
         click_count = 0
         
         while True:
             try:
-                # Try to click the "Show More" button
-                if not self._click_show_more():
-                    # Button not found or click failed - all professors loaded
-                    break
+                clicks, cards, finished = self._load_more_cards(max_items)
+                click_count += clicks
+                logger.info(f"Loaded {cards} professor cards after {click_count} 'Show More' click(s)")
                 
-                click_count += 1
-                logger.info(f"Clicked 'Show More' {click_count} time(s)")
+                if finished:
+                    # Button gone, no new cards or enough cards loaded
+                    break
                 
             except Exception as e:
                 self.error_handler.log_error(e, f"loading professors (click {click_count})")
-                logger.warning("Continuing to next iteration after error")
-                time.sleep(2)  # Wait before continuing
+                logger.warning("Stopping pagination after error")
                 break
         
         logger.info(f"Finished loading professors after {click_count} clicks")
-        time.sleep(1)  # Final wait for content to settle
 
     def extract_professor_cards(self) -> List[ProfessorSummary]:
         """
@@ -119,94 +167,109 @@ class ProfessorListScraper:
             List of ProfessorSummary objects
         """
         logger.info("Starting professor card extraction...")
+        professors, _ = self._extract_cards_from(0)
+        logger.info(f"Successfully extracted {len(professors)} professors")
+        return professors
+    
+    def _extract_cards_from(self, start: int) -> Tuple[List[ProfessorSummary], int]:
+        """
+        Extract the professor cards at or after a given position on the page.
+        
+        Args:
+            start: Number of cards already extracted
+            
+        Returns:
+            Tuple of (new ProfessorSummary objects, total number of cards on the page)
+        """
         professors = []
         
         try:
-            # Locate all professor cards using CSS selector
-            cards = self.driver.find_elements(
-                By.CSS_SELECTOR, 
-                "a[class^='TeacherCard__StyledTeacherCard']"
-            )
+            # Parse the page once and locate all professor cards
+            tree = lxml.html.fromstring(self.driver.page_source, parser=self._parser)
+            cards = self._card_xpath(tree)
             
-            logger.info(f"Found {len(cards)} professor cards")
+            total = len(cards)
+            logger.info(f"Found {total - start} new professor cards")
             
-            for idx, card in enumerate(cards, 1):
+            # Cards are parsed from the local tree, so there is no wire latency
+            # to overlap; a plain loop beats handing lxml work to threads
+            debug = logger.isEnabledFor(logging.DEBUG)
+            for idx, card in enumerate(cards[start:], start + 1):
                 try:
                     professor = self._extract_single_card(card)
                     if professor:
                         professors.append(professor)
-                        logger.debug(f"Extracted professor {idx}/{len(cards)}: {professor.professor_name}")
+                        if debug:
+                            logger.debug(f"Extracted professor {idx}/{total}: {professor.professor_name}")
                 except Exception as e:
                     logger.warning(f"Error extracting card {idx}: {e}")
                     continue
             
-            logger.info(f"Successfully extracted {len(professors)} professors")
-            return professors
+            return professors, total
             
         except Exception as e:
             logger.error(f"Error during card extraction: {e}")
-            return professors
+            return professors, start
+    
+    @staticmethod
+    def _element_text(elements) -> str:
+        """
+        Get the text of the first matched element, one line per text node.
+        
+        Args:
+            elements: Result of a compiled XPath expression
+            
+        Returns:
+            Text of the first element
+            
+        Raises:
+            NoSuchElementException: If nothing matched
+        """
+        if not elements:
+            raise NoSuchElementException("Card element not found")
+        return "\n".join(t.strip() for t in elements[0].itertext() if t.strip())
     
     def _extract_single_card(self, card) -> ProfessorSummary:
         """
         Extract data from a single professor card element with error handling.
         
         Args:
-            card: WebElement representing a professor card
+            card: lxml element representing a professor card
             
         Returns:
             ProfessorSummary object or None if extraction fails
         """
         try:
             # Extract professor page URL from the card link
-            professor_page_url = card.get_attribute('href')
+            professor_page_url = urljoin(self.base_url, card.get('href') or '')
             
             # Extract professor name
-            name_element = card.find_element(
-                By.CSS_SELECTOR, 
-                "div[class*='CardName']"
-            )
-            professor_name = self.cleaner.clean_text(name_element.text)
+            professor_name = self.cleaner.clean_text(self._element_text(self._name_xpath(card)))
             
             # Extract department and university from CardSchool section
-            school_element = card.find_element(
-                By.CSS_SELECTOR,
-                "div[class*='CardSchool']"
-            )
-            school_text = school_element.text.strip()
+            school_text = self._element_text(self._school_xpath(card)).strip()
             
             # Split department and university (format: "Department / University")
-            parts = school_text.split('/')
-            department = self.cleaner.clean_text(parts[0]) if len(parts) > 0 else "Unknown"
-            university = self.cleaner.clean_text(parts[1]) if len(parts) > 1 else "University of South Florida"
+            parts = school_text.split('/', 1)
+            department = self.cleaner.clean_text(parts[0]) or "Unknown"
+            university = (self.cleaner.clean_text(parts[1]) if len(parts) == 2 else "") or "University of South Florida"
             
             # Extract average quality rating
-            quality_element = card.find_element(
-                By.CSS_SELECTOR,
-                "div[class*='CardNumRating']"
-            )
-            avg_quality = self.cleaner.parse_number(quality_element.text) or 0.0
+            avg_quality = self.cleaner.parse_number(self._element_text(self._quality_xpath(card))) or 0.0
             
             # Extract number of ratings
-            num_ratings_element = card.find_element(
-                By.CSS_SELECTOR,
-                "div[class*='CardNumRating'] + div"
-            )
-            num_ratings_text = num_ratings_element.text
-            num_ratings = self.cleaner.parse_number(num_ratings_text.split()[0]) or 0
-            num_ratings = int(num_ratings)
+            num_ratings_text = self._element_text(self._num_ratings_xpath(card))
+            match = _LEADING_COUNT_RE.match(num_ratings_text)
+            num_ratings = int(self.cleaner.parse_number(match.group(1)) or 0) if match else 0
             
             # Extract feedback items (difficulty and would take again)
-            feedback_elements = card.find_elements(
-                By.CSS_SELECTOR,
-                "div[class*='CardFeedback']"
-            )
+            feedback_elements = self._feedback_xpath(card)
             
             avg_difficulty = 0.0
             would_take_again_pct = None
             
             for feedback in feedback_elements:
-                text = feedback.text.strip()
+                text = self._element_text([feedback]).strip()
                 
                 # Check if this is the difficulty rating
                 if "Level of Difficulty" in text or "difficulty" in text.lower():
@@ -231,9 +294,7 @@ class ProfessorListScraper:
                 professor_page_url=professor_page_url
             )
             
-            # Validate the professor data
-            professor.validate()
-            
+            # Validated in bulk by the caller once the listing is complete
             return professor
             
         except Exception as e:
@@ -244,17 +305,22 @@ class ProfessorListScraper:
         """
         Save professor summary list to JSON file with UTF-8 encoding.
         
+        Each professor is encoded by orjson and written as it is reached, so
+        no intermediate list of dictionaries is built.
+        
         Args:
             professors: List of ProfessorSummary objects to save
             output_file: Output file path (default: usf_professors_main.json)
         """
         try:
-            # Convert professors to dictionaries
-            professors_data = [prof.to_dict() for prof in professors]
-            
-            # Write to JSON file with UTF-8 encoding
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(professors_data, f, indent=2, ensure_ascii=False)
+            # Stream the JSON array one record at a time; orjson emits UTF-8 directly
+            with atomic_open(output_file) as f:
+                f.write(b'[\n')
+                for idx, prof in enumerate(professors):
+                    if idx:
+                        f.write(b',\n')
+                    f.write(orjson.dumps(prof, option=orjson.OPT_INDENT_2))
+                f.write(b'\n]\n')
             
             logger.info(f"Successfully saved {len(professors)} professors to {output_file}")
             
@@ -262,13 +328,66 @@ class ProfessorListScraper:
             logger.error(f"Error saving to JSON: {e}")
             raise
     
-    def scrape(self, save_output: bool = True, output_file: str = "usf_professors_main.json") -> List[ProfessorSummary]:
+    async def iter_summaries(self, max_items: Optional[int] = None) -> AsyncIterator[ProfessorSummary]:
+        """
+        Yield professor summaries batch by batch while the listing is paginated.
+        
+        Cards loaded by each short burst of "Show More" clicks are extracted and
+        yielded before the next burst, so callers can start on the first professors without
+        waiting for the whole listing. Blocking WebDriver calls run in a worker
+        thread to keep the event loop free.
+        
+        Args:
+            max_items: Stop after yielding this many summaries (default: all)
+            
+        Yields:
+            ProfessorSummary objects in listing order
+        """
+        logger.info("Starting professor list streaming...")
+        await asyncio.to_thread(self.navigate_to_listing)
+        
+        seen = 0
+        yielded = 0
+        click_count = 0
+        finished = False
+        while True:
+            professors, seen = await asyncio.to_thread(self._extract_cards_from, seen)
+            for professor in professors:
+                yield professor
+                yielded += 1
+                if max_items is not None and yielded >= max_items:
+                    logger.info(f"Reached {max_items} professors, stopping pagination")
+                    return
+            
+            if finished:
+                break
+            
+            # Load the next batches; a short budget keeps results streaming
+            try:
+                clicks, _, finished = await asyncio.to_thread(self._load_more_cards, max_items, 2.0)
+            except Exception as e:
+                logger.warning(f"Error clicking 'Show More' button: {e}")
+                break
+            if not clicks:
+                break
+            
+            click_count += clicks
+            logger.info(f"Clicked 'Show More' {click_count} time(s)")
+        
+        logger.info(f"Finished streaming professors after {click_count} clicks ({seen} cards)")
+    
+    def scrape(self, save_output: bool = True, output_file: str = "usf_professors_main.json",
+               max_items: Optional[int] = None) -> List[ProfessorSummary]:
         """
         Main method to orchestrate the full scraping workflow.
         
+        Cards that fail validation are kept in the result; each problem is
+        logged as a warning once the listing has been extracted.
+        
         Args:
             save_output: Whether to save results to JSON file
             output_file: Output file path if saving
+            max_items: Maximum number of professors to extract (default: all)
             
         Returns:
             List of ProfessorSummary objects
@@ -279,10 +398,16 @@ class ProfessorListScraper:
         self.navigate_to_listing()
         
         # Load all professors by clicking "Show More"
-        self.load_all_professors()
+        self.load_all_professors(max_items)
         
         # Extract all professor cards
         professors = self.extract_professor_cards()
+        if max_items is not None:
+            professors = professors[:max_items]
+        
+        # Cards are no longer validated one by one during extraction
+        for problem in validate_summaries(professors):
+            logger.warning(f"Invalid professor summary: {problem}")
         
         # Save to JSON if requested
         if save_output:
@@ -0,0 +1,273 @@
+"""Parsing of the embedded page data that RateMyProfessor ships with each professor page."""
+
+import json
+import logging
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional
+
+import lxml.html
+import orjson
+
+from ..models.professor import Professor, ProfessorSummary
+from ..models.review import Review
+from ..utils.cleaner import DataCleaner
+
+logger = logging.getLogger(__name__)
+
+RELAY_STORE_MARKER = "window.__RELAY_STORE__"
+
+PROFESSOR_URL = "https://www.ratemyprofessors.com/professor/{}"
+
+# RMP stores the distribution as r1..r5 counts (r5 = Awesome)
+DISTRIBUTION_KEYS = {
+    "Awesome": "r5",
+    "Great": "r4",
+    "Good": "r3",
+    "OK": "r2",
+    "Awful": "r1"
+}
+
+ATTENDANCE_VALUES = {
+    "mandatory": "Mandatory",
+    "non mandatory": "Not Mandatory"
+}
+
+cleaner = DataCleaner()
+
+
+def extract_teacher_data(html: str) -> Optional[Dict[str, Any]]:
+    """
+    Extract the teacher record from the JSON embedded in a professor page.
+
+    Supports both the Next.js ``__NEXT_DATA__`` blob and the normalized
+    ``window.__RELAY_STORE__`` assignment used by the Relay client.
+
+    Args:
+        html: Raw HTML of a professor detail page
+
+    Returns:
+        Teacher dictionary in GraphQL response shape, or None if not found
+    """
+    if not html or not html.strip():
+        return None
+
+    tree = lxml.html.fromstring(html)
+
+    for blob in tree.xpath('//script[@id="__NEXT_DATA__"]/text()'):
+        try:
+            data = orjson.loads(blob)
+            teacher = data.get("props", {}).get("pageProps", {}).get("teacher")
+            if teacher:
+                return teacher
+        except (ValueError, AttributeError) as e:
+            logger.debug(f"Could not parse __NEXT_DATA__ blob: {e}")
+
+    for text in tree.xpath(f'//script[contains(text(), "{RELAY_STORE_MARKER}")]/text()'):
+        store = _decode_relay_store(text)
+        if store:
+            return _teacher_from_relay_store(store)
+
+    return None
+
+
+def _decode_relay_store(script_text: str) -> Optional[Dict[str, Any]]:
+    """Decode the object literal assigned to window.__RELAY_STORE__."""
+    start = script_text.find("{", script_text.find(RELAY_STORE_MARKER))
+    if start == -1:
+        return None
+
+    try:
+        store, _ = json.JSONDecoder().raw_decode(script_text, start)
+        return store
+    except ValueError as e:
+        logger.debug(f"Could not decode relay store: {e}")
+        return None
+
+
+def _teacher_from_relay_store(store: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Find the Teacher record in a relay store and resolve its references."""
+    for record in store.values():
+        if isinstance(record, dict) and record.get("__typename") == "Teacher" and "lastName" in record:
+            return _resolve(record, store, set())
+    return None
+
+
+def _resolve(value: Any, store: Dict[str, Any], seen: set) -> Any:
+    """Recursively replace relay __ref/__refs pointers with the records they point to."""
+    if isinstance(value, list):
+        return [_resolve(item, store, seen) for item in value]
+
+    if not isinstance(value, dict):
+        return value
+
+    if "__ref" in value:
+        ref = value["__ref"]
+        if ref in seen or ref not in store:
+            return None
+        return _resolve(store[ref], store, seen | {ref})
+
+    if "__refs" in value:
+        return [
+            _resolve(store[ref], store, seen | {ref})
+            for ref in value["__refs"]
+            if ref in store and ref not in seen
+        ]
+
+    resolved = {}
+    for key, item in value.items():
+        # Relay keys connection fields by their arguments, e.g. "ratings(first:20)"
+        name = key.split("(", 1)[0]
+        resolved[name] = _resolve(item, store, seen)
+    return resolved
+
+
+def _would_take_again(teacher: Dict[str, Any]) -> Optional[int]:
+    """Round the would-take-again percentage; RMP reports -1 when it is unknown."""
+    would_take_again = teacher.get("wouldTakeAgainPercent")
+    if would_take_again is None or would_take_again < 0:
+        return None
+    return cleaner.round_percentage(would_take_again)
+
+
+def _unique_tags(texts: Iterable[str]) -> List[str]:
+    """Clean tag texts, dropping empty and duplicate tags while keeping their order."""
+    tags = []
+    seen = set()
+    for text in texts:
+        tag_text = cleaner.clean_text(text)
+        if tag_text and tag_text not in seen:
+            seen.add(tag_text)
+            tags.append(tag_text)
+    return tags
+
+
+def build_summary(teacher: Dict[str, Any]) -> ProfessorSummary:
+    """
+    Build a ProfessorSummary from a teacher search result.
+
+    Args:
+        teacher: Teacher dictionary in GraphQL response shape
+
+    Returns:
+        ProfessorSummary object
+    """
+    name = f"{teacher.get('firstName') or ''} {teacher.get('lastName') or ''}"
+    school = teacher.get("school") or {}
+
+    return ProfessorSummary(
+        professor_name=cleaner.clean_text(name) or "Unknown",
+        department=cleaner.clean_text(teacher.get("department") or "") or "Unknown",
+        university=cleaner.clean_text(school.get("name") or "") or "University of South Florida",
+        num_ratings=int(teacher.get("numRatings") or 0),
+        avg_quality=float(teacher.get("avgRating") or 0.0),
+        avg_difficulty=float(teacher.get("avgDifficulty") or 0.0),
+        would_take_again_pct=_would_take_again(teacher),
+        professor_page_url=PROFESSOR_URL.format(teacher.get("legacyId"))
+    )
+
+
+def build_professor(teacher: Dict[str, Any]) -> Professor:
+    """
+    Build a Professor from a teacher record.
+
+    Args:
+        teacher: Teacher dictionary in GraphQL response shape
+
+    Returns:
+        Professor object with metadata and reviews
+    """
+    name = f"{teacher.get('firstName') or ''} {teacher.get('lastName') or ''}"
+
+    tags = _unique_tags((tag or {}).get("tagName", "") for tag in teacher.get("teacherRatingTags") or [])
+
+    reviews = [build_review(node) for node in _rating_nodes(teacher)]
+
+    distribution_data = teacher.get("ratingsDistribution")
+    if distribution_data:
+        rating_distribution = {
+            category: int(distribution_data.get(key) or 0)
+            for category, key in DISTRIBUTION_KEYS.items()
+        }
+    else:
+        rating_distribution = rating_distribution_from_reviews(reviews)
+
+    return Professor(
+        professor_name=cleaner.clean_text(name) or "Unknown",
+        department=cleaner.clean_text(teacher.get("department") or "") or "Unknown",
+        overall_quality=float(teacher.get("avgRating") or 0.0),
+        difficulty_level=float(teacher.get("avgDifficulty") or 0.0),
+        would_take_again=_would_take_again(teacher),
+        rating_distribution=rating_distribution,
+        tags=tags,
+        reviews=reviews
+    )
+
+
+def rating_distribution_from_reviews(reviews: List[Review]) -> Dict[str, int]:
+    """
+    Count reviews per rating category from their quality scores.
+
+    Used when a page does not carry the professor's own distribution.
+
+    Args:
+        reviews: Reviews of one professor
+
+    Returns:
+        Dictionary with rating categories as keys and counts as values
+    """
+    counts = Counter(int(round(review.quality_score)) for review in reviews)
+    return {
+        category: counts[int(key[1])]
+        for category, key in DISTRIBUTION_KEYS.items()
+    }
+
+
+def _rating_nodes(teacher: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Return the rating nodes from the teacher's ratings connection."""
+    ratings = teacher.get("ratings") or {}
+    nodes = []
+    for edge in ratings.get("edges") or []:
+        node = (edge or {}).get("node")
+        if node:
+            nodes.append(node)
+    return nodes
+
+
+def build_review(node: Dict[str, Any]) -> Review:
+    """
+    Build a Review from a rating node.
+
+    Args:
+        node: Rating dictionary in GraphQL response shape
+
+    Returns:
+        Review object
+    """
+    attendance = ATTENDANCE_VALUES.get((node.get("attendanceMandatory") or "").lower(), "Not Specified")
+
+    textbook_use = node.get("textbookUse")
+    if textbook_use is None or textbook_use < 0:
+        textbook_used = "Not Specified"
+    else:
+        textbook_used = "Yes" if textbook_use > 0 else "No"
+
+    tags = _unique_tags((node.get("ratingTags") or "").split("--"))
+
+    difficulty = node.get("difficultyRatingRounded")
+    if difficulty is None:
+        difficulty = node.get("difficultyRating")
+
+    return Review(
+        course_code=cleaner.clean_text(node.get("class") or "") or "Unknown",
+        for_credit=node.get("isForCredit") is not False,
+        attendance=attendance,
+        grade=cleaner.clean_text(node.get("grade") or "") or "Not Specified",
+        textbook_used=textbook_used,
+        quality_score=float(node.get("qualityRating") or 0.0),
+        difficulty_score=float(difficulty or 0.0),
+        review_text=cleaner.clean_text(node.get("comment") or ""),
+        tags=tags,
+        date_posted=node.get("date") or "",
+        helpful_upvotes=int(node.get("thumbsUpTotal") or 0),
+        helpful_downvotes=int(node.get("thumbsDownTotal") or 0)
+    )
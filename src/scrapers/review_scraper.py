@@ -3,16 +3,143 @@
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
-from typing import List
+from typing import AbstractSet, Iterable, List, Optional, Sequence
 import logging
+import re
 import time
 
+import lxml.html
+from lxml import etree
+
 from ..models.review import Review
 from ..utils.cleaner import DataCleaner
 from ..utils.error_handler import ErrorHandler
 
 logger = logging.getLogger(__name__)
 
+# Review card selectors, most specific first. The CSS form counts cards in the
+# live page while reviews load; the XPath form finds them in the page source.
+REVIEW_CARD_SELECTORS = [
+    "div[class*='Rating__StyledRating']",
+    "div[class*='Rating-']",
+    "li[class*='Rating']",
+    "div[class*='RatingItem']"
+]
+
+# Turns the first card selector that matches into an exact tag.class selector
+# built from the matching class name, which the browser looks up by class
+# instead of substring-scanning every element's class attribute
+CARD_CLASS_SELECTOR_JS = """
+for (const selector of arguments[0]) {
+    const card = document.querySelector(selector);
+    if (!card) continue;
+    const fragment = selector.match(/\\*='([^']+)'/)[1];
+    const name = Array.from(card.classList).find(c => c.includes(fragment));
+    return name ? card.tagName.toLowerCase() + "." + CSS.escape(name) : selector;
+}
+return null;
+"""
+
+# Resolves with whether more than prevCount review cards appeared within
+# timeoutMs, polling inside the page instead of once per WebDriver call
+WAIT_FOR_MORE_CARDS_JS = """
+const [cardSelector, prevCount, timeoutMs, done] = arguments;
+const started = Date.now();
+const poll = () => {
+    if (document.querySelectorAll(cardSelector).length > prevCount) done(true);
+    else if (Date.now() - started >= timeoutMs) done(false);
+    else setTimeout(poll, 50);
+};
+poll();
+"""
+
+REVIEW_CARD_XPATHS = (
+    etree.XPath("//div[contains(@class, 'Rating__StyledRating')]"),
+    etree.XPath("//div[contains(@class, 'Rating-')]"),
+    etree.XPath("//li[contains(@class, 'Rating')]"),
+    etree.XPath("//div[contains(@class, 'RatingItem')]")
+)
+
+# Selector alternatives for each review field, in priority order, evaluated
+# relative to a review card
+COURSE_XPATHS = (
+    etree.XPath(".//div[contains(@class, 'RatingHeader__StyledClass')]"),
+    etree.XPath(".//div[contains(@class, 'CourseName')]"),
+    etree.XPath(".//div[contains(@class, 'Class')]")
+)
+
+CREDIT_XPATHS = (
+    etree.XPath(".//div[contains(@class, 'MetaItem') and contains(@class, 'Credit')]"),
+    etree.XPath(".//span[contains(@class, 'Credit')]")
+)
+
+ATTENDANCE_XPATHS = (
+    etree.XPath(".//div[contains(@class, 'MetaItem') and contains(@class, 'Attendance')]"),
+    etree.XPath(".//span[contains(@class, 'Attendance')]")
+)
+
+GRADE_XPATHS = (
+    etree.XPath(".//div[contains(@class, 'MetaItem') and contains(@class, 'Grade')]"),
+    etree.XPath(".//span[contains(@class, 'Grade')]")
+)
+
+TEXTBOOK_XPATHS = (
+    etree.XPath(".//div[contains(@class, 'MetaItem') and contains(@class, 'Textbook')]"),
+    etree.XPath(".//span[contains(@class, 'Textbook')]")
+)
+
+# The :first-child / :last-child rating values have no preceding / following sibling
+QUALITY_XPATHS = (
+    etree.XPath(".//div[contains(@class, 'CardNumRating__CardNumRatingNumber') and contains(@class, 'quality')]"),
+    etree.XPath(".//div[contains(@class, 'Quality')]//div[contains(@class, 'CardNumRating')]"),
+    etree.XPath(".//div[contains(@class, 'RatingValues__RatingValue')][not(preceding-sibling::*)]")
+)
+
+DIFFICULTY_XPATHS = (
+    etree.XPath(".//div[contains(@class, 'CardNumRating__CardNumRatingNumber') and contains(@class, 'difficulty')]"),
+    etree.XPath(".//div[contains(@class, 'Difficulty')]//div[contains(@class, 'CardNumRating')]"),
+    etree.XPath(".//div[contains(@class, 'RatingValues__RatingValue')][not(following-sibling::*)]")
+)
+
+RATING_NUMBER_XPATH = etree.XPath(".//div[contains(@class, 'CardNumRating')]")
+
+COMMENT_XPATHS = (
+    etree.XPath(".//div[contains(@class, 'Comments__StyledComments')]"),
+    etree.XPath(".//div[contains(@class, 'RatingComment')]"),
+    etree.XPath(".//div[contains(@class, 'CommentText')]"),
+    etree.XPath(".//div[contains(@class, 'Comment')]")
+)
+
+TAG_XPATHS = (
+    etree.XPath(".//span[contains(@class, 'Tag-')]"),
+    etree.XPath(".//div[contains(@class, 'RatingTag')]"),
+    etree.XPath(".//span[contains(@class, 'RatingTag')]")
+)
+
+DATE_XPATHS = (
+    etree.XPath(".//div[contains(@class, 'TimeStamp')]"),
+    etree.XPath(".//div[contains(@class, 'Date')]"),
+    etree.XPath(".//time"),
+    etree.XPath(".//span[contains(@class, 'Date')]")
+)
+
+HELPFUL_XPATH = etree.XPath(
+    ".//div[contains(@class, 'Helpful')] | .//button[contains(@class, 'Helpful')]"
+    " | .//div[contains(@class, 'Thumbs')]"
+)
+
+_CREDIT_RE = re.compile(r'credit:\s*(yes|no)', re.IGNORECASE)
+_ATTENDANCE_RE = re.compile(r'Attendance:\s*(\w+)', re.IGNORECASE)
+_GRADE_RE = re.compile(
+    r'Grade\s*(?:Received)?:\s*([A-F][+-]?|Pass|Fail|Incomplete|Withdraw|Audit|Not sure yet|Rather not say)',
+    re.IGNORECASE
+)
+_TEXTBOOK_RE = re.compile(r'Textbook:\s*(\w+(?:\s+\w+)?)', re.IGNORECASE)
+# "not helpful" is tried before "helpful" so downvotes are not read as upvotes;
+# \W* keeps a count from being paired with a label further along the text
+_HELPFUL_RE = re.compile(r'(not helpful|thumbs down|helpful|thumbs up)\W*(\d+)', re.IGNORECASE)
+_DOWNVOTE_LABELS = frozenset({'not helpful', 'thumbs down'})
+
 
 class ReviewScraper:
     """Scraper for extracting reviews from professor detail pages."""
@@ -27,6 +154,11 @@ class ReviewScraper:
         self.driver = driver
         self.cleaner = DataCleaner()
         self.error_handler = ErrorHandler(max_retries=3)
+        
+        # Winning selector per lookup; the site's class names are the same on
+        # every review and every page, so it is tried first from then on
+        self._selector_cache = {}
+        self._parser = lxml.html.HTMLParser(recover=True)
         logger.debug("ReviewScraper initialized")
 
     def load_all_reviews(self) -> None:
@@ -64,19 +196,28 @@ class ReviewScraper:
                     logger.info(f"Load More button not found after {clicks} clicks. All reviews loaded.")
                     break
                 
-                # Scroll to button before clicking
+                # Scroll to button before clicking; an instant scrollIntoView
+                # has finished by the time the script returns
                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
-                time.sleep(0.5)  # Wait for scroll to complete
+                
+                prev_count = self._count_review_cards()
                 
                 # Click the button
                 try:
                     button.click()
                     clicks += 1
-                    consecutive_errors = 0  # Reset error counter on success
                     logger.debug(f"Clicked Load More button (click #{clicks})")
                     
-                    # Add delay to avoid rate limiting and allow content to load
-                    time.sleep(1.5)
+                    # Wait for the next batch of reviews instead of a fixed delay
+                    self._wait_for_more_reviews(prev_count)
+                    consecutive_errors = 0  # Reset error counter on success
+                    
+                except TimeoutException:
+                    logger.warning("No new reviews loaded after clicking Load More")
+                    consecutive_errors += 1
+                    if consecutive_errors >= max_consecutive_errors:
+                        logger.error(f"Too many consecutive errors ({consecutive_errors}). Stopping review loading.")
+                        break
                     
                 except Exception as e:
                     logger.warning(f"Error clicking Load More button: {e}")
@@ -86,9 +227,9 @@ class ReviewScraper:
                     try:
                         self.driver.execute_script("arguments[0].click();", button)
                         clicks += 1
-                        consecutive_errors = 0  # Reset error counter on success
                         logger.debug(f"Clicked Load More button via JavaScript (click #{clicks})")
-                        time.sleep(1.5)
+                        self._wait_for_more_reviews(prev_count)
+                        consecutive_errors = 0  # Reset error counter on success
                     except Exception as js_error:
                         self.error_handler.log_error(js_error, "clicking Load More button")
                         consecutive_errors += 1
@@ -120,35 +261,70 @@ class ReviewScraper:
         
         logger.info(f"Finished loading reviews after {clicks} Load More clicks")
 
-    def extract_reviews(self) -> List[Review]:
+    def _card_selector(self) -> str:
+        """CSS selector for review cards: the exact class once known, else all candidates."""
+        selector = self._selector_cache.get('cards')
+        if selector is None:
+            selector = self.driver.execute_script(CARD_CLASS_SELECTOR_JS, REVIEW_CARD_SELECTORS)
+            if selector:
+                self._selector_cache['cards'] = selector
+        return selector or ", ".join(REVIEW_CARD_SELECTORS)
+    
+    def _count_review_cards(self) -> int:
+        """Count the review cards currently on the page."""
+        # Counted in a script: one round trip covers all candidate selectors
+        return self.driver.execute_script("return document.querySelectorAll(arguments[0]).length;",
+                                          self._card_selector())
+    
+    def _wait_for_more_reviews(self, prev_count: int, timeout: float = 5) -> None:
+        """
+        Wait until more than prev_count review cards are on the page.
+        
+        Args:
+            prev_count: Number of review cards before clicking Load More
+            timeout: Maximum seconds to wait
+            
+        Raises:
+            TimeoutException: If no new reviews appeared in time
+        """
+        # One async script call covers the whole wait
+        appeared = self.driver.execute_async_script(
+            WAIT_FOR_MORE_CARDS_JS, self._card_selector(), prev_count, int(timeout * 1000)
+        )
+        if not appeared:
+            raise TimeoutException(f"No new reviews after {timeout}s")
+    
+    def extract_reviews(self, fields: Optional[Iterable[str]] = None) -> List[Review]:
         """
         Extract all review data from the current page.
         
+        The loaded page is serialized once and parsed with lxml, so every
+        field is read locally instead of through WebDriver calls.
+        
+        Args:
+            fields: Review fields the caller needs (default: all). The course
+                code, scores and review text are always extracted; other
+                fields left out keep their "not found" defaults.
+        
         Returns:
-            List of Review objects with all extracted fields
+            List of Review objects with the requested fields extracted
         """
         reviews = []
+        if fields is not None:
+            fields = frozenset(fields)
         
         try:
-            # Find all review elements on the page
-            # Try multiple selectors for review cards
+            tree = lxml.html.fromstring(self.driver.page_source, parser=self._parser)
+            
+            # Cards from the most specific selector that matches; the broader
+            # selectors would also match elements nested inside the cards
             review_elements = []
-            selectors = [
-                "div[class*='Rating__StyledRating']",
-                "div[class*='Rating-']",
-                "li[class*='Rating']",
-                "div[class*='RatingItem']"
-            ]
-            
-            for selector in selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        review_elements = elements
-                        logger.debug(f"Found {len(elements)} review elements using selector: {selector}")
-                        break
-                except NoSuchElementException:
-                    continue
+            for idx, card_xpath in enumerate(REVIEW_CARD_XPATHS):
+                review_elements = card_xpath(tree)
+                if review_elements:
+                    logger.debug(f"Found {len(review_elements)} review elements using selector: "
+                                 f"{REVIEW_CARD_SELECTORS[idx]}")
+                    break
             
             if not review_elements:
                 logger.warning("No review elements found on page")
@@ -159,7 +335,7 @@ class ReviewScraper:
             # Extract data from each review element
             for idx, element in enumerate(review_elements):
                 try:
-                    review = self._parse_review_element(element)
+                    review = self._parse_review_element(element, fields)
                     if review:
                         reviews.append(review)
                         logger.debug(f"Successfully parsed review {idx + 1}/{len(review_elements)}")
@@ -174,24 +350,56 @@ class ReviewScraper:
             logger.error(f"Error extracting reviews: {e}")
             return reviews
     
-    def _parse_review_element(self, element) -> Review:
+    @staticmethod
+    def _first_match(element, xpaths: Sequence[etree.XPath]) -> list:
+        """
+        Get the matches of the first selector that matches anything.
+        
+        Args:
+            element: lxml element to search under
+            xpaths: Compiled selector alternatives in priority order
+            
+        Returns:
+            Matched elements, or an empty list
+        """
+        for xpath in xpaths:
+            matches = xpath(element)
+            if matches:
+                return matches
+        return []
+    
+    def _parse_review_element(self, element, fields: Optional[AbstractSet[str]] = None) -> Review:
         """
         Parse a single review element and extract all fields with error handling.
         
         Args:
-            element: WebElement containing review data
+            element: lxml element containing review data
+            fields: Optional fields to extract (default: all); see extract_reviews()
             
         Returns:
             Review object with extracted data
         """
+        def wanted(*names: str) -> bool:
+            return fields is None or not fields.isdisjoint(names)
+        
         # Extract course code
         course_code = self._extract_course_code(element)
         
         # Extract metadata fields (for_credit, attendance, grade, textbook_used)
-        for_credit = self._extract_for_credit(element)
-        attendance = self._extract_attendance(element)
-        grade = self._extract_grade(element)
-        textbook_used = self._extract_textbook_used(element)
+        for_credit, attendance, grade, textbook_used = True, "Not Specified", "Not Specified", "Not Specified"
+        if wanted('for_credit', 'attendance', 'grade', 'textbook_used'):
+            # Join the review's text nodes once, one per line, as the browser
+            # would render them; the metadata helpers all search it
+            full_text = "\n".join(t.strip() for t in element.itertext() if t.strip())
+            
+            if wanted('for_credit'):
+                for_credit = self._extract_for_credit(element, full_text)
+            if wanted('attendance'):
+                attendance = self._extract_attendance(element, full_text)
+            if wanted('grade'):
+                grade = self._extract_grade(element, full_text)
+            if wanted('textbook_used'):
+                textbook_used = self._extract_textbook_used(element, full_text)
         
         # Extract quality and difficulty scores
         quality_score = self._extract_quality_score(element)
@@ -201,13 +409,15 @@ class ReviewScraper:
         review_text = self._extract_review_text(element)
         
         # Extract tags
-        tags = self._extract_review_tags(element)
+        tags = self._extract_review_tags(element) if wanted('tags') else []
         
         # Extract date posted
-        date_posted = self._extract_date_posted(element)
+        date_posted = self._extract_date_posted(element) if wanted('date_posted') else ""
         
         # Extract helpful votes
-        helpful_upvotes, helpful_downvotes = self._extract_helpful_votes(element)
+        helpful_upvotes, helpful_downvotes = 0, 0
+        if wanted('helpful_upvotes', 'helpful_downvotes'):
+            helpful_upvotes, helpful_downvotes = self._extract_helpful_votes(element)
         
         # Create Review object
         review = Review(
@@ -231,20 +441,11 @@ class ReviewScraper:
         """Extract course code from review element."""
         try:
             # Try multiple selectors for course code
-            selectors = [
-                "div[class*='RatingHeader__StyledClass']",
-                "div[class*='CourseName']",
-                "div[class*='Class']"
-            ]
-            
-            for selector in selectors:
-                try:
-                    course_element = element.find_element(By.CSS_SELECTOR, selector)
-                    course_code = self.cleaner.clean_text(course_element.text)
+            for xpath in COURSE_XPATHS:
+                for course_element in xpath(element)[:1]:
+                    course_code = self.cleaner.clean_text(course_element.text_content())
                     if course_code:
                         return course_code
-                except NoSuchElementException:
-                    continue
             
             logger.debug("Course code not found, using 'Unknown'")
             return "Unknown"
@@ -253,31 +454,19 @@ class ReviewScraper:
             logger.debug(f"Error extracting course code: {e}")
             return "Unknown"
     
-    def _extract_for_credit(self, element) -> bool:
+    def _extract_for_credit(self, element, full_text: str) -> bool:
         """Extract for_credit field from review element."""
         try:
-            # Look for "For Credit" indicator
-            text = element.text.lower()
-            
-            # Check for explicit indicators
-            if 'for credit: yes' in text or 'credit: yes' in text:
-                return True
-            elif 'for credit: no' in text or 'credit: no' in text:
-                return False
+            # Look for an explicit "For Credit" indicator
+            match = _CREDIT_RE.search(full_text)
+            if match:
+                return match.group(1).lower() == 'yes'
             
             # Try to find specific element
-            selectors = [
-                "div[class*='MetaItem'][class*='Credit']",
-                "span[class*='Credit']"
-            ]
-            
-            for selector in selectors:
-                try:
-                    credit_element = element.find_element(By.CSS_SELECTOR, selector)
-                    credit_text = credit_element.text.lower()
+            for xpath in CREDIT_XPATHS:
+                for credit_element in xpath(element)[:1]:
+                    credit_text = credit_element.text_content().lower()
                     return 'yes' in credit_text
-                except NoSuchElementException:
-                    continue
             
             # Default to True if not specified
             return True
@@ -286,33 +475,36 @@ class ReviewScraper:
             logger.debug(f"Error extracting for_credit: {e}")
             return True
     
-    def _extract_attendance(self, element) -> str:
+    def _extract_meta_value(self, element, xpaths: Sequence[etree.XPath]) -> Optional[str]:
+        """
+        Read a "Label: value" metadata element.
+        
+        Args:
+            element: lxml element containing review data
+            xpaths: Compiled selector alternatives in priority order
+            
+        Returns:
+            Value after the label, or None if no selector matched
+        """
+        for xpath in xpaths:
+            for meta_element in xpath(element)[:1]:
+                meta_text = self.cleaner.clean_text(meta_element.text_content())
+                # Extract the value after the label
+                if ':' in meta_text:
+                    return meta_text.split(':', 1)[1].strip()
+                return meta_text
+        return None
+    
+    def _extract_attendance(self, element, full_text: str) -> str:
         """Extract attendance field from review element."""
         try:
-            # Look for attendance information
-            text = element.text
-            
             # Try to find specific element
-            selectors = [
-                "div[class*='MetaItem'][class*='Attendance']",
-                "span[class*='Attendance']"
-            ]
-            
-            for selector in selectors:
-                try:
-                    attendance_element = element.find_element(By.CSS_SELECTOR, selector)
-                    attendance_text = self.cleaner.clean_text(attendance_element.text)
-                    # Extract the value after the label
-                    if ':' in attendance_text:
-                        attendance = attendance_text.split(':', 1)[1].strip()
-                        return attendance
-                    return attendance_text
-                except NoSuchElementException:
-                    continue
+            attendance = self._extract_meta_value(element, ATTENDANCE_XPATHS)
+            if attendance is not None:
+                return attendance
             
             # Try to extract from full text using regex
-            import re
-            match = re.search(r'Attendance:\s*(\w+)', text, re.IGNORECASE)
+            match = _ATTENDANCE_RE.search(full_text)
             if match:
                 return match.group(1)
             
@@ -322,33 +514,16 @@ class ReviewScraper:
             logger.debug(f"Error extracting attendance: {e}")
             return "Not Specified"
     
-    def _extract_grade(self, element) -> str:
+    def _extract_grade(self, element, full_text: str) -> str:
         """Extract grade field from review element."""
         try:
-            # Look for grade information
-            text = element.text
-            
             # Try to find specific element
-            selectors = [
-                "div[class*='MetaItem'][class*='Grade']",
-                "span[class*='Grade']"
-            ]
-            
-            for selector in selectors:
-                try:
-                    grade_element = element.find_element(By.CSS_SELECTOR, selector)
-                    grade_text = self.cleaner.clean_text(grade_element.text)
-                    # Extract the value after the label
-                    if ':' in grade_text:
-                        grade = grade_text.split(':', 1)[1].strip()
-                        return grade
-                    return grade_text
-                except NoSuchElementException:
-                    continue
+            grade = self._extract_meta_value(element, GRADE_XPATHS)
+            if grade is not None:
+                return grade
             
             # Try to extract from full text using regex
-            import re
-            match = re.search(r'Grade\s*(?:Received)?:\s*([A-F][+-]?|Pass|Fail|Incomplete|Withdraw|Audit|Not sure yet|Rather not say)', text, re.IGNORECASE)
+            match = _GRADE_RE.search(full_text)
             if match:
                 return match.group(1)
             
@@ -358,33 +533,16 @@ class ReviewScraper:
             logger.debug(f"Error extracting grade: {e}")
             return "Not Specified"
     
-    def _extract_textbook_used(self, element) -> str:
+    def _extract_textbook_used(self, element, full_text: str) -> str:
         """Extract textbook_used field from review element."""
         try:
-            # Look for textbook information
-            text = element.text
-            
             # Try to find specific element
-            selectors = [
-                "div[class*='MetaItem'][class*='Textbook']",
-                "span[class*='Textbook']"
-            ]
-            
-            for selector in selectors:
-                try:
-                    textbook_element = element.find_element(By.CSS_SELECTOR, selector)
-                    textbook_text = self.cleaner.clean_text(textbook_element.text)
-                    # Extract the value after the label
-                    if ':' in textbook_text:
-                        textbook = textbook_text.split(':', 1)[1].strip()
-                        return textbook
-                    return textbook_text
-                except NoSuchElementException:
-                    continue
+            textbook = self._extract_meta_value(element, TEXTBOOK_XPATHS)
+            if textbook is not None:
+                return textbook
             
             # Try to extract from full text using regex
-            import re
-            match = re.search(r'Textbook:\s*(\w+(?:\s+\w+)?)', text, re.IGNORECASE)
+            match = _TEXTBOOK_RE.search(full_text)
             if match:
                 return match.group(1)
             
@@ -394,37 +552,37 @@ class ReviewScraper:
             logger.debug(f"Error extracting textbook_used: {e}")
             return "Not Specified"
     
+    def _extract_score(self, element, xpaths: Sequence[etree.XPath], position: int) -> Optional[float]:
+        """
+        Read a rating number from the first selector whose match parses.
+        
+        Args:
+            element: lxml element containing review data
+            xpaths: Compiled selector alternatives in priority order
+            position: Index of the score among the card's rating numbers,
+                used when no selector matched
+            
+        Returns:
+            Score, or None if not found
+        """
+        for xpath in xpaths:
+            for score_element in xpath(element)[:1]:
+                score = self.cleaner.parse_number(score_element.text_content().strip())
+                if score is not None:
+                    return score
+        
+        # Fall back to the card's rating numbers in page order
+        rating_elements = RATING_NUMBER_XPATH(element)
+        if len(rating_elements) > position:
+            return self.cleaner.parse_number(rating_elements[position].text_content().strip())
+        return None
+    
     def _extract_quality_score(self, element) -> float:
         """Extract quality score from review element."""
         try:
-            # Try multiple selectors for quality rating
-            selectors = [
-                "div[class*='CardNumRating__CardNumRatingNumber'][class*='quality']",
-                "div[class*='Quality'] div[class*='CardNumRating']",
-                "div[class*='RatingValues__RatingValue']:first-child"
-            ]
-            
-            for selector in selectors:
-                try:
-                    quality_element = element.find_element(By.CSS_SELECTOR, selector)
-                    quality_text = quality_element.text.strip()
-                    quality = self.cleaner.parse_number(quality_text)
-                    if quality is not None:
-                        return quality
-                except NoSuchElementException:
-                    continue
-            
-            # Try to find any element with "QUALITY" text nearby
-            try:
-                # Look for elements containing rating numbers
-                rating_elements = element.find_elements(By.CSS_SELECTOR, "div[class*='CardNumRating']")
-                if len(rating_elements) >= 1:
-                    quality_text = rating_elements[0].text.strip()
-                    quality = self.cleaner.parse_number(quality_text)
-                    if quality is not None:
-                        return quality
-            except Exception:
-                pass
+            quality = self._extract_score(element, QUALITY_XPATHS, 0)
+            if quality is not None:
+                return quality
             
             logger.debug("Quality score not found, using 0.0")
             return 0.0
@@ -436,34 +594,9 @@ class ReviewScraper:
     def _extract_difficulty_score(self, element) -> float:
         """Extract difficulty score from review element."""
         try:
-            # Try multiple selectors for difficulty rating
-            selectors = [
-                "div[class*='CardNumRating__CardNumRatingNumber'][class*='difficulty']",
-                "div[class*='Difficulty'] div[class*='CardNumRating']",
-                "div[class*='RatingValues__RatingValue']:last-child"
-            ]
-            
-            for selector in selectors:
-                try:
-                    difficulty_element = element.find_element(By.CSS_SELECTOR, selector)
-                    difficulty_text = difficulty_element.text.strip()
-                    difficulty = self.cleaner.parse_number(difficulty_text)
-                    if difficulty is not None:
-                        return difficulty
-                except NoSuchElementException:
-                    continue
-            
-            # Try to find any element with "DIFFICULTY" text nearby
-            try:
-                # Look for elements containing rating numbers
-                rating_elements = element.find_elements(By.CSS_SELECTOR, "div[class*='CardNumRating']")
-                if len(rating_elements) >= 2:
-                    difficulty_text = rating_elements[1].text.strip()
-                    difficulty = self.cleaner.parse_number(difficulty_text)
-                    if difficulty is not None:
-                        return difficulty
-            except Exception:
-                pass
+            difficulty = self._extract_score(element, DIFFICULTY_XPATHS, 1)
+            if difficulty is not None:
+                return difficulty
             
             logger.debug("Difficulty score not found, using 0.0")
             return 0.0
@@ -476,21 +609,11 @@ class ReviewScraper:
         """Extract and clean review text from review element."""
         try:
             # Try multiple selectors for review comment text
-            selectors = [
-                "div[class*='Comments__StyledComments']",
-                "div[class*='RatingComment']",
-                "div[class*='CommentText']",
-                "div[class*='Comment']"
-            ]
-            
-            for selector in selectors:
-                try:
-                    text_element = element.find_element(By.CSS_SELECTOR, selector)
-                    review_text = self.cleaner.clean_text(text_element.text)
+            for xpath in COMMENT_XPATHS:
+                for text_element in xpath(element)[:1]:
+                    review_text = self.cleaner.clean_text(text_element.text_content())
                     if review_text:
                         return review_text
-                except NoSuchElementException:
-                    continue
             
             logger.debug("Review text not found")
             return ""
@@ -502,30 +625,18 @@ class ReviewScraper:
     def _extract_review_tags(self, element) -> List[str]:
         """Extract tags from review element."""
         tags = []
+        seen = set()
         
         try:
-            # Try multiple selectors for tags
-            selectors = [
-                "span[class*='Tag-']",
-                "div[class*='RatingTag']",
-                "span[class*='RatingTag']"
-            ]
-            
-            tag_elements = []
-            for selector in selectors:
-                try:
-                    elements = element.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        tag_elements = elements
-                        break
-                except NoSuchElementException:
-                    continue
+            # Tags from the first selector that matches
+            tag_elements = self._first_match(element, TAG_XPATHS)
             
-            # Extract text from each tag
+            # Extract text from each tag, keeping first-seen order
             for tag_element in tag_elements:
                 try:
-                    tag_text = self.cleaner.clean_text(tag_element.text)
-                    if tag_text and tag_text not in tags:
+                    tag_text = self.cleaner.clean_text(tag_element.text_content())
+                    if tag_text and tag_text not in seen:
+                        seen.add(tag_text)
                         tags.append(tag_text)
                 except Exception:
                     continue
@@ -540,21 +651,11 @@ class ReviewScraper:
         """Extract date posted from review element."""
         try:
             # Try multiple selectors for date
-            selectors = [
-                "div[class*='TimeStamp']",
-                "div[class*='Date']",
-                "time",
-                "span[class*='Date']"
-            ]
-            
-            for selector in selectors:
-                try:
-                    date_element = element.find_element(By.CSS_SELECTOR, selector)
-                    date_text = self.cleaner.clean_text(date_element.text)
+            for xpath in DATE_XPATHS:
+                for date_element in xpath(element)[:1]:
+                    date_text = self.cleaner.clean_text(date_element.text_content())
                     if date_text:
                         return date_text
-                except NoSuchElementException:
-                    continue
             
             return ""
             
@@ -573,38 +674,13 @@ class ReviewScraper:
         downvotes = 0
         
         try:
-            # Try to find helpful/not helpful buttons or counts
-            selectors = [
-                "div[class*='Helpful']",
-                "button[class*='Helpful']",
-                "div[class*='Thumbs']"
-            ]
-            
-            for selector in selectors:
-                try:
-                    helpful_elements = element.find_elements(By.CSS_SELECTOR, selector)
-                    
-                    for helpful_element in helpful_elements:
-                        text = helpful_element.text.lower()
-                        
-                        # Extract numbers from text
-                        import re
-                        numbers = re.findall(r'\d+', text)
-                        
-                        if 'helpful' in text and numbers:
-                            upvotes = int(numbers[0])
-                        elif 'not helpful' in text and numbers:
-                            downvotes = int(numbers[0])
-                        elif 'thumbs up' in text and numbers:
-                            upvotes = int(numbers[0])
-                        elif 'thumbs down' in text and numbers:
-                            downvotes = int(numbers[0])
-                    
-                    if upvotes > 0 or downvotes > 0:
-                        break
-                        
-                except NoSuchElementException:
-                    continue
+            # Helpful/not helpful buttons or counts from all selectors at once
+            for helpful_element in HELPFUL_XPATH(element):
+                for label, count in _HELPFUL_RE.findall(helpful_element.text_content()):
+                    if label.lower() in _DOWNVOTE_LABELS:
+                        downvotes = int(count)
+                    else:
+                        upvotes = int(count)
             
             return upvotes, downvotes
             
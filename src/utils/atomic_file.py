@@ -0,0 +1,47 @@
+"""Crash-safe file writes: write to a temporary file, then atomically rename it."""
+
+import os
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator
+
+
+@contextmanager
+def atomic_open(path: str) -> Iterator[BinaryIO]:
+    """
+    Open a buffered binary file that replaces path only once fully written.
+
+    Data goes to path + ".tmp", which is flushed, synced once and renamed over
+    path on success, so readers never see a half-written file. On error the
+    temporary file is removed and path is left untouched.
+
+    Args:
+        path: Destination file path
+
+    Yields:
+        Writable binary file object
+    """
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'wb', buffering=1 << 20) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def atomic_dump(path: str, payload: bytes) -> None:
+    """
+    Atomically replace path with payload.
+
+    Args:
+        path: Destination file path
+        payload: Complete file contents
+    """
+    with atomic_open(path) as f:
+        f.write(payload)
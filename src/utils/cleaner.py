@@ -4,7 +4,21 @@ Handles text normalization, HTML removal, and type conversions.
 """
 
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, List, Optional
+
+# Short field values (departments, tags, ratings) repeat across the whole run
+# and are memoized; longer strings such as review bodies are nearly always
+# unique and bypass the caches
+CACHEABLE_LENGTH = 200
+
+# Placeholders the site shows when a value is missing
+_NOT_AVAILABLE = frozenset({'N/A', 'NA', 'NONE', '--', ''})
+
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_NON_ASCII_RE = re.compile(r'[^\x00-\x7F]+')
+_NON_NUMERIC_RE = re.compile(r'[^\d.\-]')
+_PERCENTAGE_RE = re.compile(r'(\d+(?:\.\d+)?)\s*%?')
 
 
 class DataCleaner:
@@ -24,21 +38,35 @@ class DataCleaner:
         if not text or not isinstance(text, str):
             return ""
         
-        # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
+        # Already clean: printable ASCII (no tabs or newlines), no tags and no
+        # doubled spaces, so only the ends can need trimming
+        if text.isascii() and text.isprintable() and '<' not in text and '  ' not in text:
+            return text.strip()
+        
+        if len(text) <= CACHEABLE_LENGTH:
+            return DataCleaner._clean_text_cached(text)
+        return DataCleaner._clean_text_impl(text)
+    
+    @staticmethod
+    def _clean_text_impl(text: str) -> str:
+        """Clean a non-empty string; see clean_text()."""
+        # Remove HTML tags (only possible if the text contains a '<')
+        if '<' in text:
+            text = _HTML_TAG_RE.sub('', text)
         
-        # Normalize whitespace: replace multiple spaces/newlines with single space
-        text = re.sub(r'\s+', ' ', text)
+        # Normalize whitespace: split() collapses the same whitespace runs as
+        # \s+ and drops leading and trailing whitespace in the same C pass
+        text = ' '.join(text.split())
         
         # Remove emojis and other non-ASCII characters
         # Keep basic punctuation and alphanumeric characters
-        text = re.sub(r'[^\x00-\x7F]+', '', text)
-        
-        # Strip leading and trailing whitespace
-        text = text.strip()
+        if not text.isascii():
+            text = _NON_ASCII_RE.sub('', text).strip()
         
         return text
     
+    _clean_text_cached = staticmethod(lru_cache(maxsize=8192)(_clean_text_impl.__func__))
+    
     @staticmethod
     def parse_number(value: str) -> Optional[float]:
         """
@@ -53,20 +81,68 @@ class DataCleaner:
         if not value or not isinstance(value, str):
             return None
         
+        if len(value) <= CACHEABLE_LENGTH:
+            return DataCleaner._parse_number_cached(value)
+        return DataCleaner._parse_number_impl(value)
+    
+    @staticmethod
+    def _parse_number_impl(value: str) -> Optional[float]:
+        """Parse a non-empty string; see parse_number()."""
         # Clean the string
         value = value.strip()
         
         # Handle common "not available" cases
-        if value.upper() in ['N/A', 'NA', 'NONE', '--', '']:
+        if value.upper() in _NOT_AVAILABLE:
             return None
         
+        # Plain decimals such as "4.3" need no cleanup
+        if value.lstrip('-').replace('.', '', 1).isdigit():
+            try:
+                return float(value)
+            except ValueError:
+                pass  # Non-ASCII digits; let the regex path drop them
+        
         try:
             # Remove any non-numeric characters except decimal point and minus sign
-            cleaned = re.sub(r'[^\d.\-]', '', value)
+            cleaned = _NON_NUMERIC_RE.sub('', value)
             return float(cleaned)
         except (ValueError, AttributeError):
             return None
     
+    _parse_number_cached = staticmethod(lru_cache(maxsize=8192)(_parse_number_impl.__func__))
+    
+    @staticmethod
+    def parse_numbers(values: Iterable[str]) -> List[Optional[float]]:
+        """
+        Convert a whole column of number strings, e.g. every review's score.
+        
+        Repeated values are answered from the parse_number cache, so a batch
+        costs one parse per distinct string.
+        
+        Args:
+            values: String representations of numbers
+            
+        Returns:
+            Float values in input order, None where conversion fails
+        """
+        return list(map(DataCleaner.parse_number, values))
+    
+    @staticmethod
+    def round_percentage(percentage: float) -> int:
+        """
+        Round a non-negative percentage half up (12.5 -> 13).
+        
+        Shared by the listing cards and the API/page data so a professor gets
+        the same value whichever path produced the record.
+        
+        Args:
+            percentage: Percentage between 0 and 100
+            
+        Returns:
+            Rounded integer percentage
+        """
+        return int(percentage + 0.5)
+    
     @staticmethod
     def parse_percentage(value: str) -> Optional[int]:
         """
@@ -81,26 +157,49 @@ class DataCleaner:
         if not value or not isinstance(value, str):
             return None
         
+        if len(value) <= CACHEABLE_LENGTH:
+            return DataCleaner._parse_percentage_cached(value)
+        return DataCleaner._parse_percentage_impl(value)
+    
+    @staticmethod
+    def _parse_percentage_impl(value: str) -> Optional[int]:
+        """Parse a non-empty string; see parse_percentage()."""
         # Clean the string
         value = value.strip()
         
         # Handle common "not available" cases
-        if value.upper() in ['N/A', 'NA', 'NONE', '--', '']:
+        if value.upper() in _NOT_AVAILABLE:
             return None
         
         try:
             # Extract numeric value from percentage string
             # Matches patterns like "85%", "85 %", "85 percent"
-            match = re.search(r'(\d+(?:\.\d+)?)\s*%?', value)
+            match = _PERCENTAGE_RE.search(value)
             if match:
                 percentage = float(match.group(1))
                 # Ensure it's within valid percentage range
                 if 0 <= percentage <= 100:
-                    return int(round(percentage))
+                    return DataCleaner.round_percentage(percentage)
             return None
         except (ValueError, AttributeError):
             return None
     
+    _parse_percentage_cached = staticmethod(lru_cache(maxsize=8192)(_parse_percentage_impl.__func__))
+    
+    @staticmethod
+    def cache_info() -> dict:
+        """
+        Report hit statistics of the memoized cleaners, for sizing the caches.
+        
+        Returns:
+            Dictionary mapping each cleaner name to its functools cache_info()
+        """
+        return {
+            'clean_text': DataCleaner._clean_text_cached.cache_info(),
+            'parse_number': DataCleaner._parse_number_cached.cache_info(),
+            'parse_percentage': DataCleaner._parse_percentage_cached.cache_info(),
+        }
+    
     @staticmethod
     def parse_boolean(value: str) -> bool:
         """
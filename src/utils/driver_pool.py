@@ -0,0 +1,79 @@
+"""Pool of headless Chrome worker processes for pages that need a real browser."""
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.util import Finalize
+from typing import Optional
+
+from ..models.professor import Professor
+
+logger = logging.getLogger(__name__)
+
+# Per-process scraper created by _init_driver and reused for every task
+_scraper = None
+
+
+def _init_driver(headless: bool) -> None:
+    """Start one persistent WebDriver in the current worker process."""
+    global _scraper
+
+    # Imported here so the parent process does not load Selenium for the pool
+    from ..scrapers.detail_scraper import ProfessorDetailScraper
+    from .webdriver_manager import WebDriverManager
+
+    manager = WebDriverManager(headless=headless)
+    _scraper = ProfessorDetailScraper(manager.get_driver())
+
+    # Quit the browser when the worker process shuts down
+    Finalize(manager, manager.quit_driver, exitpriority=10)
+
+
+def _scrape_one(url: str) -> Optional[Professor]:
+    """Scrape one professor page with this worker's driver."""
+    return _scraper.scrape_professor(url)
+
+
+class DriverPool:
+    """
+    Bounded pool of worker processes, each owning one persistent WebDriver.
+
+    Browsers are only started once the first page is submitted, so a run
+    that never needs one pays nothing for the pool.
+    """
+
+    def __init__(self, processes: int = 2, headless: bool = True):
+        """
+        Initialize the DriverPool.
+
+        Args:
+            processes: Number of worker processes (one browser each)
+            headless: Run the browsers in headless mode
+        """
+        self.processes = processes
+        self._executor = ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_driver,
+            initargs=(headless,)
+        )
+        logger.info(f"DriverPool initialized with {processes} worker processes")
+
+    async def scrape(self, url: str) -> Optional[Professor]:
+        """
+        Scrape a professor page in one of the worker browsers.
+
+        Args:
+            url: URL of the professor's detail page
+
+        Returns:
+            Professor object, or None if scraping failed
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, _scrape_one, url)
+
+    def close(self) -> None:
+        """Shut down the worker processes and their browsers."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        logger.info("DriverPool closed")
@@ -1,8 +1,10 @@
 """Error handling utilities with retry logic and logging."""
 
+import asyncio
 import logging
+import random
 import time
-from typing import Callable, Any, Optional
+from typing import Awaitable, Callable, Any, Optional, Tuple, Type
 from functools import wraps
 from selenium.common.exceptions import (
     NoSuchElementException,
@@ -11,19 +13,50 @@ from selenium.common.exceptions import (
     WebDriverException
 )
 
+logger = logging.getLogger(__name__)
+
+# Transient failures worth retrying; anything else is a bug or a permanent
+# error and is raised on the first attempt
+RETRYABLE_EXCEPTIONS = (
+    TimeoutException,
+    StaleElementReferenceException,
+    WebDriverException,
+    ConnectionError
+)
+
 
 class ErrorHandler:
     """Handles errors with retry logic and exponential backoff."""
     
-    def __init__(self, max_retries: int = 3):
+    def __init__(self, max_retries: int = 3, max_delay: float = 30.0,
+                 retry_on: Tuple[Type[BaseException], ...] = RETRYABLE_EXCEPTIONS):
         """
         Initialize ErrorHandler.
         
         Args:
             max_retries: Maximum number of retry attempts
+            max_delay: Upper bound on a single backoff sleep in seconds
+            retry_on: Exception types retry_with_backoff retries; others are
+                raised immediately
         """
         self.max_retries = max_retries
-        self.logger = logging.getLogger(__name__)
+        self.max_delay = max_delay
+        self.retry_on = retry_on
+    
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        Seconds to wait after a failed attempt.
+        
+        The exponential delay is stretched by a random 0-50% so workers that
+        failed together do not all retry at the same instant.
+        
+        Args:
+            attempt: Zero-based number of the failed attempt
+            
+        Returns:
+            Delay in seconds, at most max_delay
+        """
+        return min(self.max_delay, (2 ** attempt) * (1.0 + random.uniform(0, 0.5)))
     
     def retry_with_backoff(
         self, 
@@ -34,7 +67,8 @@ class ErrorHandler:
         """
         Retry a function with exponential backoff.
         
-        Implements exponential backoff: 1s, 2s, 4s for up to 3 retries.
+        Implements exponential backoff with jitter: about 1s, 2s, 4s for up
+        to 3 retries, each stretched by up to 50% and capped at max_delay.
         
         Args:
             func: Function to retry
@@ -45,31 +79,88 @@ class ErrorHandler:
             Result of successful function call
             
         Raises:
-            Exception: Last exception if all retries fail
+            Exception: Last exception if all retries fail, or the first
+                exception that is not one of retry_on
         """
         last_exception = None
         
         for attempt in range(self.max_retries):
             try:
                 return func(*args, **kwargs)
-            except (
-                TimeoutException,
-                WebDriverException,
-                ConnectionError,
-                Exception
-            ) as e:
+            except self.retry_on as e:
                 last_exception = e
-                wait_time = 2 ** attempt  # 1s, 2s, 4s
+                wait_time = self._backoff_delay(attempt)
                 
-                self.logger.warning(
+                logger.warning(
                     f"Attempt {attempt + 1}/{self.max_retries} failed: {str(e)}. "
-                    f"Retrying in {wait_time}s..."
+                    f"Retrying in {wait_time:.1f}s..."
                 )
                 
                 if attempt < self.max_retries - 1:
                     time.sleep(wait_time)
                 else:
-                    self.logger.error(
+                    logger.error(
+                        f"All {self.max_retries} attempts failed for {func.__name__}"
+                    )
+            except Exception as e:
+                logger.error(f"Not retrying {func.__name__} after unrecoverable error: {e!r}")
+                raise
+        
+        raise last_exception
+    
+    async def retry_with_backoff_async(
+        self,
+        func: Callable[..., Awaitable[Any]],
+        *args,
+        is_retryable: Optional[Callable[[Exception], bool]] = None,
+        **kwargs
+    ) -> Any:
+        """
+        Retry a coroutine function with exponential backoff.
+        
+        Same schedule as retry_with_backoff (about 1s, 2s, 4s), but waits with
+        asyncio.sleep so other tasks keep running during the backoff.
+        
+        Args:
+            func: Coroutine function to retry
+            *args: Positional arguments for func
+            is_retryable: Predicate deciding whether an exception is worth
+                retrying, overriding retry_on; non-retryable exceptions are
+                raised immediately (default: retry instances of retry_on)
+            **kwargs: Keyword arguments for func
+            
+        Returns:
+            Result of successful function call
+            
+        Raises:
+            Exception: Last exception if all retries fail, or the first
+                exception that is not retryable
+        """
+        if is_retryable is None:
+            is_retryable = lambda e: isinstance(e, self.retry_on)
+        
+        last_exception = None
+        
+        for attempt in range(self.max_retries):
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                if not is_retryable(e):
+                    logger.error(f"Not retrying {func.__name__} after unrecoverable error: {e!r}")
+                    raise
+                
+                last_exception = e
+                wait_time = self._backoff_delay(attempt)
+                
+                logger.warning(
+                    f"Attempt {attempt + 1}/{self.max_retries} failed: {str(e)}. "
+                    f"Retrying in {wait_time:.1f}s..."
+                )
+                
+                if attempt < self.max_retries - 1:
+                    await asyncio.sleep(wait_time)
+                else:
+                    logger.error(
                         f"All {self.max_retries} attempts failed for {func.__name__}"
                     )
         
@@ -97,7 +188,7 @@ class ErrorHandler:
         try:
             return func(*args, **kwargs)
         except (NoSuchElementException, TimeoutException) as e:
-            self.logger.warning(
+            logger.warning(
                 f"Element not found on first attempt: {selector}. Retrying..."
             )
             
@@ -107,7 +198,7 @@ class ErrorHandler:
             try:
                 return func(*args, **kwargs)
             except (NoSuchElementException, TimeoutException) as retry_error:
-                self.logger.error(
+                logger.error(
                     f"Element not found after retry: {selector}. "
                     f"Error: {str(retry_error)}"
                 )
@@ -121,7 +212,7 @@ class ErrorHandler:
             error: Exception that occurred
             context: Context description (e.g., "scraping professor X")
         """
-        self.logger.error(
+        logger.error(
             f"Error in {context}: {type(error).__name__} - {str(error)}",
             exc_info=True
         )
@@ -1,19 +1,59 @@
 """JSON writer utility for serializing professor data."""
 
-import json
 import logging
+from collections import defaultdict
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Iterable, List, Dict, Any, Optional
+
+import orjson
 
 from src.models import Professor
+from src.utils.atomic_file import atomic_dump, atomic_open
+
+logger = logging.getLogger(__name__)
+
+# Keys every serialized professor must have
+REQUIRED_FIELDS = frozenset({'professor_name', 'department', 'overall_quality',
+                             'difficulty_level', 'reviews'})
+
+
+def _check_required_fields(idx: int, record: Any) -> None:
+    """
+    Raise if a professor record (dict or dataclass) lacks a required field.
+    
+    Args:
+        idx: Position of the record in the output array
+        record: Professor object or dictionary
+        
+    Raises:
+        ValueError: If a required field is missing or reviews is not a list
+    """
+    if isinstance(record, dict):
+        missing_fields = REQUIRED_FIELDS.difference(record)
+        reviews = record.get('reviews')
+    else:
+        missing_fields = {name for name in REQUIRED_FIELDS if getattr(record, name, None) is None}
+        reviews = getattr(record, 'reviews', None)
+    
+    if missing_fields:
+        raise ValueError(f"Item at index {idx} missing required fields: {sorted(missing_fields)}")
+    if not isinstance(reviews, list):
+        raise ValueError(f"Item at index {idx} has invalid 'reviews' field (must be a list)")
 
 
 class JSONWriter:
     """Handles serialization and writing of professor data to JSON files."""
     
-    def __init__(self):
-        """Initialize the JSONWriter."""
-        self.logger = logging.getLogger(__name__)
+    def __init__(self, pretty: bool = False):
+        """
+        Initialize the JSONWriter.
+        
+        Args:
+            pretty: Indent output files for readability (default: compact)
+        """
+        self.dump_option = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+        if pretty:
+            self.dump_option |= orjson.OPT_INDENT_2
     
     def serialize_professors(self, professors: List[Professor]) -> List[Dict[str, Any]]:
         """
@@ -25,7 +65,7 @@ class JSONWriter:
         Returns:
             List of dictionaries representing professor data
         """
-        self.logger.info(f"Serializing {len(professors)} professors to JSON format...")
+        logger.info(f"Serializing {len(professors)} professors to JSON format...")
         
         serialized_data = []
         for professor in professors:
@@ -34,18 +74,18 @@ class JSONWriter:
                 prof_dict = professor.to_dict()
                 serialized_data.append(prof_dict)
             except Exception as e:
-                self.logger.error(f"Error serializing professor {professor.professor_name}: {e}")
+                logger.error(f"Error serializing professor {professor.professor_name}: {e}")
                 continue
         
-        self.logger.info(f"Successfully serialized {len(serialized_data)} professors")
+        logger.info(f"Successfully serialized {len(serialized_data)} professors")
         return serialized_data
     
-    def write_json(self, data: List[Dict[str, Any]], output_file: str) -> bool:
+    def write_json(self, data: List[Any], output_file: str) -> bool:
         """
         Write serialized data to JSON file with UTF-8 encoding.
         
         Args:
-            data: List of dictionaries to write
+            data: List of dictionaries or dataclass instances to write
             output_file: Path to output file
             
         Returns:
@@ -56,18 +96,17 @@ class JSONWriter:
             output_path = Path(output_file)
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Write to JSON file with UTF-8 encoding and indentation for readability
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # orjson encodes to UTF-8 bytes in one call; replace the file atomically
+            atomic_dump(output_file, orjson.dumps(data, option=self.dump_option))
             
-            self.logger.info(f"Successfully wrote {len(data)} records to {output_file}")
+            logger.info(f"Successfully wrote {len(data)} records to {output_file}")
             return True
             
         except IOError as e:
-            self.logger.error(f"IO error writing to {output_file}: {e}")
+            logger.error(f"IO error writing to {output_file}: {e}")
             return False
         except Exception as e:
-            self.logger.error(f"Unexpected error writing to {output_file}: {e}")
+            logger.error(f"Unexpected error writing to {output_file}: {e}")
             return False
     
     def validate_json_structure(self, data: List[Dict[str, Any]]) -> bool:
@@ -81,103 +120,113 @@ class JSONWriter:
             True if valid, False otherwise
         """
         if not isinstance(data, list):
-            self.logger.error("Data must be a list")
+            logger.error("Data must be a list")
             return False
         
         if len(data) == 0:
-            self.logger.warning("Data list is empty")
+            logger.warning("Data list is empty")
             return True  # Empty list is valid
         
         # Check that each item is a dictionary with required fields
-        required_fields = ['professor_name', 'department', 'overall_quality', 
-                          'difficulty_level', 'reviews']
-        
         for idx, item in enumerate(data):
             if not isinstance(item, dict):
-                self.logger.error(f"Item at index {idx} is not a dictionary")
+                logger.error(f"Item at index {idx} is not a dictionary")
                 return False
             
             # Check for required fields
-            missing_fields = [field for field in required_fields if field not in item]
+            missing_fields = REQUIRED_FIELDS.difference(item)
             if missing_fields:
-                self.logger.error(f"Item at index {idx} missing required fields: {missing_fields}")
+                logger.error(f"Item at index {idx} missing required fields: {sorted(missing_fields)}")
                 return False
             
             # Check that reviews is a list
             if not isinstance(item.get('reviews'), list):
-                self.logger.error(f"Item at index {idx} has invalid 'reviews' field (must be a list)")
+                logger.error(f"Item at index {idx} has invalid 'reviews' field (must be a list)")
                 return False
         
-        self.logger.info(f"JSON structure validation passed for {len(data)} items")
+        logger.info(f"JSON structure validation passed for {len(data)} items")
         return True
     
-    def save_professors(self, professors: List[Professor], output_file: str) -> bool:
+    def save_professors(self, professors: Iterable[Professor], output_file: str) -> bool:
         """
-        Complete workflow to serialize, validate, and save professors to JSON.
+        Complete workflow to serialize and save professors to JSON.
+        
+        The array is written one professor at a time, so neither a list of
+        dictionaries nor the full encoded file is held in memory. Each record
+        is checked for the required fields as it is written; a missing field
+        aborts the write and leaves any existing output file untouched.
         
         Args:
-            professors: List of Professor objects
+            professors: Professor objects (any iterable, consumed in a single pass)
             output_file: Path to output file
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            # Serialize professors to dictionaries
-            serialized_data = self.serialize_professors(professors)
-            
-            if not serialized_data:
-                self.logger.error("No data to write after serialization")
-                return False
-            
-            # Validate JSON structure
-            if not self.validate_json_structure(serialized_data):
-                self.logger.error("JSON structure validation failed")
+            professors = iter(professors)
+            first = next(professors, None)
+            if first is None:
+                logger.error("No data to write")
                 return False
             
-            # Write to file
-            success = self.write_json(serialized_data, output_file)
+            Path(output_file).parent.mkdir(parents=True, exist_ok=True)
             
-            if success:
-                self.logger.info(f"Successfully saved {len(professors)} professors to {output_file}")
+            # orjson serializes the dataclasses natively, so no intermediate
+            # to_dict() copies are built
+            option = self.dump_option & ~orjson.OPT_APPEND_NEWLINE
+            count = 1
+            with atomic_open(output_file) as f:
+                _check_required_fields(0, first)
+                f.write(b'[\n')
+                f.write(orjson.dumps(first, option=option))
+                for professor in professors:
+                    _check_required_fields(count, professor)
+                    f.write(b',\n')
+                    f.write(orjson.dumps(professor, option=option))
+                    count += 1
+                f.write(b'\n]\n')
             
-            return success
+            logger.info(f"Successfully saved {count} professors to {output_file}")
+            return True
             
         except Exception as e:
-            self.logger.error(f"Error in save_professors workflow: {e}")
+            logger.error(f"Error in save_professors workflow: {e}")
             return False
 
-    def generate_summary_report(self, professors: List[Professor], 
+    def generate_summary_report(self, professors: Iterable[Professor], 
                                 errors: Optional[List[str]] = None,
                                 skipped: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Generate a summary report of the scraping operation.
         
         Args:
-            professors: List of successfully scraped Professor objects
+            professors: Successfully scraped Professor objects (any iterable,
+                consumed in a single pass)
             errors: List of error messages encountered during scraping
             skipped: List of professor names that were skipped
             
         Returns:
             Dictionary containing summary statistics
         """
-        total_professors = len(professors)
-        total_reviews = sum(len(prof.reviews) for prof in professors)
-        
-        # Calculate average reviews per professor
-        avg_reviews_per_prof = total_reviews / total_professors if total_professors > 0 else 0
+        total_professors = 0
+        total_reviews = 0
         
         # Count professors by department
-        departments = {}
+        departments = defaultdict(int)
         for prof in professors:
-            dept = prof.department
-            departments[dept] = departments.get(dept, 0) + 1
+            total_professors += 1
+            total_reviews += len(prof.reviews)
+            departments[prof.department] += 1
+        
+        # Calculate average reviews per professor
+        avg_reviews_per_prof = total_reviews / total_professors if total_professors > 0 else 0
         
         summary = {
             'total_professors_scraped': total_professors,
             'total_reviews_collected': total_reviews,
             'average_reviews_per_professor': round(avg_reviews_per_prof, 2),
-            'departments': departments,
+            'departments': dict(departments),
             'errors_encountered': len(errors) if errors else 0,
             'professors_skipped': len(skipped) if skipped else 0,
             'error_list': errors if errors else [],
@@ -193,35 +242,47 @@ class JSONWriter:
         Args:
             summary: Summary dictionary from generate_summary_report
         """
-        self.logger.info("=" * 80)
-        self.logger.info("SCRAPING SUMMARY REPORT")
-        self.logger.info("=" * 80)
-        self.logger.info(f"Total Professors Scraped: {summary['total_professors_scraped']}")
-        self.logger.info(f"Total Reviews Collected: {summary['total_reviews_collected']}")
-        self.logger.info(f"Average Reviews per Professor: {summary['average_reviews_per_professor']}")
-        self.logger.info(f"Errors Encountered: {summary['errors_encountered']}")
-        self.logger.info(f"Professors Skipped: {summary['professors_skipped']}")
-        
-        if summary['departments']:
-            self.logger.info("\nProfessors by Department:")
-            for dept, count in sorted(summary['departments'].items(), key=lambda x: x[1], reverse=True):
-                self.logger.info(f"  - {dept}: {count}")
+        # One record per level instead of one per line: a single lock, format
+        # and write for the statistics and one for the problems
+        if logger.isEnabledFor(logging.INFO):
+            lines = [
+                "=" * 80,
+                "SCRAPING SUMMARY REPORT",
+                "=" * 80,
+                f"Total Professors Scraped: {summary['total_professors_scraped']}",
+                f"Total Reviews Collected: {summary['total_reviews_collected']}",
+                f"Average Reviews per Professor: {summary['average_reviews_per_professor']}",
+                f"Errors Encountered: {summary['errors_encountered']}",
+                f"Professors Skipped: {summary['professors_skipped']}"
+            ]
+            
+            if summary['departments']:
+                lines.append("\nProfessors by Department:")
+                for dept, count in sorted(summary['departments'].items(), key=lambda x: x[1], reverse=True):
+                    lines.append(f"  - {dept}: {count}")
+            
+            lines.append("=" * 80)
+            logger.info("\n".join(lines))
         
+        lines = []
         if summary['error_list']:
-            self.logger.warning("\nErrors Encountered:")
+            lines.append("Errors Encountered:")
             for error in summary['error_list'][:10]:  # Show first 10 errors
-                self.logger.warning(f"  - {error}")
+                lines.append(f"  - {error}")
             if len(summary['error_list']) > 10:
-                self.logger.warning(f"  ... and {len(summary['error_list']) - 10} more errors")
+                lines.append(f"  ... and {len(summary['error_list']) - 10} more errors")
         
         if summary['skipped_list']:
-            self.logger.warning("\nSkipped Professors:")
+            if lines:
+                lines.append("")
+            lines.append("Skipped Professors:")
             for skipped in summary['skipped_list'][:10]:  # Show first 10 skipped
-                self.logger.warning(f"  - {skipped}")
+                lines.append(f"  - {skipped}")
             if len(summary['skipped_list']) > 10:
-                self.logger.warning(f"  ... and {len(summary['skipped_list']) - 10} more skipped")
+                lines.append(f"  ... and {len(summary['skipped_list']) - 10} more skipped")
         
-        self.logger.info("=" * 80)
+        if lines:
+            logger.warning("\n".join(lines))
     
     def save_summary_report(self, summary: Dict[str, Any], output_file: str = "scraping_summary.json") -> bool:
         """
@@ -235,12 +296,11 @@ class JSONWriter:
             True if successful, False otherwise
         """
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(summary, f, indent=2, ensure_ascii=False)
+            atomic_dump(output_file, orjson.dumps(summary, option=self.dump_option))
             
-            self.logger.info(f"Summary report saved to {output_file}")
+            logger.info(f"Summary report saved to {output_file}")
             return True
             
         except Exception as e:
-            self.logger.error(f"Error saving summary report: {e}")
+            logger.error(f"Error saving summary report: {e}")
             return False
@@ -1,9 +1,27 @@
 """Logging configuration for the RMP scraper."""
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import queue
 import sys
 
+# Thread writing queued records to the handlers of the current configuration
+_listener = None
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the listener thread, if one is running."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
 
 def setup_logging(log_file: str = "scraper.log") -> None:
     """
@@ -14,6 +32,10 @@ def setup_logging(log_file: str = "scraper.log") -> None:
     - Console handler for progress updates
     - INFO, WARNING, ERROR levels
     
+    Loggers only put records on a queue; a QueueListener thread does the
+    file and console writes, so logging never blocks the scraping loop.
+    Calling this again replaces the previous configuration.
+    
     Args:
         log_file: Path to log file (default: scraper.log)
     """
@@ -21,7 +43,8 @@ def setup_logging(log_file: str = "scraper.log") -> None:
     logger = logging.getLogger()
     logger.setLevel(logging.INFO)
     
-    # Clear any existing handlers
+    # Clear any existing handlers, after writing out what they still hold
+    _stop_listener()
     logger.handlers.clear()
     
     # Create formatters
@@ -49,9 +72,12 @@ def setup_logging(log_file: str = "scraper.log") -> None:
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(console_formatter)
     
-    # Add handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Route records through a queue to the handlers on a background thread
+    global _listener
+    log_queue = queue.Queue(-1)
+    _listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    _listener.start()
+    logger.addHandler(QueueHandler(log_queue))
     
     # Log startup message
     logger.info("=" * 60)
@@ -0,0 +1,75 @@
+"""On-disk cache of scraped professors so re-runs skip already fetched pages."""
+
+import hashlib
+import logging
+import pickle
+import time
+from pathlib import Path
+from typing import Optional
+
+from ..models.professor import Professor
+from .atomic_file import atomic_open
+
+logger = logging.getLogger(__name__)
+
+
+class ProfessorCache:
+    """
+    Stores parsed Professor objects as pickles, one file per professor.
+
+    Entries older than expire_after seconds are treated as missing so the
+    professor is fetched again.
+    """
+
+    def __init__(self, directory: str = "rmp_cache", expire_after: float = 86400):
+        """
+        Initialize the ProfessorCache.
+
+        Args:
+            directory: Directory holding the cached professors
+            expire_after: Maximum age of a cache entry in seconds (default: one day)
+        """
+        self.directory = Path(directory)
+        self.expire_after = expire_after
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        """Map a professor ID or URL to its cache file."""
+        return self.directory / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.pickle"
+
+    def get(self, key: str) -> Optional[Professor]:
+        """
+        Load a cached professor.
+
+        Args:
+            key: Professor ID or page URL
+
+        Returns:
+            Cached Professor, or None if missing, expired or unreadable
+        """
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.expire_after:
+                return None
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable cache entry for {key}: {e}")
+            return None
+
+    def set(self, key: str, professor: Professor) -> None:
+        """
+        Store a professor in the cache.
+
+        Args:
+            key: Professor ID or page URL
+            professor: Professor to cache
+        """
+        try:
+            # Written atomically so a crash never leaves a truncated entry
+            with atomic_open(str(self._path(key))) as f:
+                pickle.dump(professor, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            logger.warning(f"Could not cache professor {key}: {e}")
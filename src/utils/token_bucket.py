@@ -0,0 +1,75 @@
+"""Token-bucket rate limiter shared across async scraping workers."""
+
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Rate limiter that refills tokens continuously and allows short bursts.
+
+    When the server signals overload (HTTP 429/503), the refill rate is halved
+    (down to an eighth of the base rate) for a cooldown period and then ramped
+    back up by 10% per successful request. Overload responses that arrive
+    during the cooldown do not reduce the rate further.
+    """
+
+    def __init__(self, rate: float, capacity: int, cooldown: float = 60.0):
+        """
+        Initialize the TokenBucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens (burst size)
+            cooldown: Seconds to hold a reduced rate after backing off
+        """
+        self.base_rate = rate
+        self.rate = rate
+        self.min_rate = rate / 8
+        self.capacity = capacity
+        self.cooldown = cooldown
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self._backoff_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed since the last refill."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+    async def acquire(self, n: int = 1) -> None:
+        """
+        Wait until n tokens are available and consume them.
+
+        Args:
+            n: Number of tokens to consume
+        """
+        async with self._lock:
+            self._refill()
+            while self.tokens < n:
+                await asyncio.sleep((n - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= n
+
+    def backoff(self) -> None:
+        """Halve the refill rate for the cooldown period after an overload response."""
+        now = time.monotonic()
+        if now < self._backoff_until:
+            return
+
+        self.rate = max(self.min_rate, self.rate / 2)
+        self._backoff_until = now + self.cooldown
+        logger.warning(f"Rate limited by server, reducing request rate to {self.rate:.2f}/s")
+
+    def recover(self) -> None:
+        """Ramp the refill rate back up by 10% after a successful request."""
+        if self.rate >= self.base_rate or time.monotonic() < self._backoff_until:
+            return
+
+        self.rate = min(self.base_rate, self.rate * 1.1)
+        logger.debug(f"Request rate recovered to {self.rate:.2f}/s")
@@ -0,0 +1,102 @@
+"""Bulk validation of scraped records, run once after scraping completes."""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from ..models.professor import ProfessorSummary
+
+
+def _check_required(problems: List[str], label: str, values: Sequence[str],
+                    owners: Optional[Sequence[int]] = None) -> None:
+    """Record the first empty or whitespace-only string in a column."""
+    if all(map(str.strip, values)):
+        return
+    idx = next(i for i, value in enumerate(values) if not value.strip())
+    problems.append(f"{label} is required (record {owners[idx] if owners is not None else idx})")
+
+
+def _check_range(problems: List[str], label: str, values: Sequence[float], low: float,
+                 high: Optional[float] = None, owners: Optional[Sequence[int]] = None) -> None:
+    """Record the first value in a column that falls outside [low, high]."""
+    if not values or (min(values) >= low and (high is None or max(values) <= high)):
+        return
+    idx = next(i for i, value in enumerate(values)
+               if value < low or (high is not None and value > high))
+    bounds = f"between {low} and {high}" if high is not None else "non-negative"
+    problems.append(f"{label} must be {bounds}, got {values[idx]!r} "
+                    f"(record {owners[idx] if owners is not None else idx})")
+
+
+def validate_summaries(summaries: Sequence[ProfessorSummary]) -> List[str]:
+    """
+    Validate professor summaries column by column.
+
+    Applies the same rules as ProfessorSummary.validate(), with one scan per
+    field instead of one method call per record.
+
+    Args:
+        summaries: Summaries extracted from the listing
+
+    Returns:
+        One message per failing field, naming the first offending record
+    """
+    problems = []
+
+    for name in ('professor_name', 'department', 'university', 'professor_page_url'):
+        _check_required(problems, name, [getattr(s, name) or '' for s in summaries])
+    _check_range(problems, 'num_ratings', [s.num_ratings for s in summaries], 0)
+    _check_range(problems, 'avg_quality', [s.avg_quality for s in summaries], 0, 5)
+    _check_range(problems, 'avg_difficulty', [s.avg_difficulty for s in summaries], 0, 5)
+
+    return problems
+
+
+def validate_professor_records(records: Iterable[Dict[str, Any]]) -> List[str]:
+    """
+    Validate serialized professors and their reviews in one streaming pass.
+
+    Records are gathered into per-field columns as they are read, then each
+    column is checked once with the rules of Professor.validate() and
+    Review.validate().
+
+    Args:
+        records: Professor dictionaries, e.g. parsed from the NDJSON output
+
+    Returns:
+        One message per failing field, naming the first offending record
+    """
+    names, departments, qualities, difficulties = [], [], [], []
+    would_take_again, would_take_again_owners = [], []
+    courses, review_qualities, review_difficulties, upvotes, downvotes = [], [], [], [], []
+    review_owners = []
+
+    for idx, record in enumerate(records):
+        names.append(record['professor_name'] or '')
+        departments.append(record['department'] or '')
+        qualities.append(record['overall_quality'])
+        difficulties.append(record['difficulty_level'])
+        if record.get('would_take_again') is not None:
+            would_take_again.append(record['would_take_again'])
+            would_take_again_owners.append(idx)
+
+        for review in record.get('reviews') or []:
+            courses.append(review['course_code'] or '')
+            review_qualities.append(review['quality_score'])
+            review_difficulties.append(review['difficulty_score'])
+            upvotes.append(review['helpful_upvotes'])
+            downvotes.append(review['helpful_downvotes'])
+            review_owners.append(idx)
+
+    problems = []
+    _check_required(problems, 'professor_name', names)
+    _check_required(problems, 'department', departments)
+    _check_range(problems, 'overall_quality', qualities, 0, 5)
+    _check_range(problems, 'difficulty_level', difficulties, 0, 5)
+    _check_range(problems, 'would_take_again', would_take_again, 0, 100, owners=would_take_again_owners)
+
+    _check_required(problems, 'review course_code', courses, owners=review_owners)
+    _check_range(problems, 'review quality_score', review_qualities, 0, 5, owners=review_owners)
+    _check_range(problems, 'review difficulty_score', review_difficulties, 0, 5, owners=review_owners)
+    _check_range(problems, 'review helpful_upvotes', upvotes, 0, owners=review_owners)
+    _check_range(problems, 'review helpful_downvotes', downvotes, 0, owners=review_owners)
+
+    return problems
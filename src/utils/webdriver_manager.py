@@ -8,15 +8,64 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, StaleElementReferenceException, ElementClickInterceptedException
 from webdriver_manager.chrome import ChromeDriverManager
-import time
 import logging
 
 logger = logging.getLogger(__name__)
 
+# ChromeDriver binary resolved by webdriver-manager, shared by every driver
+# this process starts
+_driver_path = None
+
+# Third-party trackers and heavy sub-resources the scrapers never read; the
+# scrapers only need the text of the DOM, so images, fonts and stylesheets go too
+BLOCKED_URLS = [
+    "*.googletagmanager.com/*",
+    "*google-analytics*",
+    "*doubleclick*",
+    "*facebook.net*",
+    "*hotjar.com*",
+    "*googlesyndication.com*",
+    "*amazon-adsystem.com*",
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.webp",
+    "*.svg",
+    "*.woff",
+    "*.woff2",
+    "*.css"
+]
+
 
 class WebDriverManager:
     """Manages Chrome WebDriver lifecycle and provides helper methods for element interaction"""
     
+    # URL patterns the browser never requests; override or extend per subclass or instance
+    blocked_urls = BLOCKED_URLS
+    
+    # Chrome switches for every driver; headless runs add HEADLESS_ARGS
+    CHROME_ARGS = (
+        # Add user-agent to avoid detection
+        'user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        # Additional options for stability
+        '--no-sandbox',
+        '--disable-dev-shm-usage',
+        '--disable-blink-features=AutomationControlled',
+        '--disable-extensions',
+        '--disable-sync',
+        '--disable-features=Translate',
+        # Skip image decoding for any image the URL patterns miss
+        '--blink-settings=imagesEnabled=false'
+    )
+    HEADLESS_ARGS = ('--headless', '--disable-gpu')
+    
+    # Never load images or show notification prompts
+    CHROME_PREFS = {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.default_content_setting_values.notifications': 2
+    }
+    
     def __init__(self, headless: bool = True, timeout: int = 10):
         """
         Initialize WebDriver Manager
@@ -29,6 +78,10 @@ class WebDriverManager:
         self.timeout = timeout
         self.driver = None
         
+        # WebDriverWait per (timeout, poll frequency), reused for every lookup
+        # on the current driver
+        self._waits = {}
+        
     def get_driver(self) -> webdriver.Chrome:
         """
         Initialize and return Chrome WebDriver with configured options
@@ -40,34 +93,54 @@ class WebDriverManager:
             return self.driver
             
         # Configure Chrome options
-        chrome_options = Options()
+        chrome_options = self._build_options(self.headless)
         
-        if self.headless:
-            chrome_options.add_argument('--headless')
-            chrome_options.add_argument('--disable-gpu')
-        
-        # Add user-agent to avoid detection
-        chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-        
-        # Additional options for stability
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-automation'])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        
-        # Initialize driver
-        service = Service(ChromeDriverManager().install())
+        # Initialize driver; install() checks versions and the file system,
+        # so it runs once per process
+        global _driver_path
+        if _driver_path is None:
+            _driver_path = ChromeDriverManager().install()
+        service = Service(_driver_path)
         self.driver = webdriver.Chrome(service=service, options=chrome_options)
         
         # Configure timeouts
-        self.driver.implicitly_wait(5)  # 5 second implicit wait
+        # No implicit wait: every wait is an explicit WebDriverWait, and an
+        # implicit one would stall each poll and each missing-element lookup
+        self.driver.implicitly_wait(0)
         self.driver.set_page_load_timeout(30)  # 30 second page load timeout
         
+        # Block trackers and heavy resources for every page this driver loads
+        self.driver.execute_cdp_cmd('Network.enable', {})
+        self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(self.blocked_urls)})
+        
         logger.info(f"WebDriver initialized (headless={self.headless}, timeout={self.timeout}s)")
         
         return self.driver
     
+    @classmethod
+    def _build_options(cls, headless: bool) -> Options:
+        """
+        Build fresh Chrome options from the class-level configuration.
+        
+        Args:
+            headless: Add the headless switches
+            
+        Returns:
+            Options for a new driver
+        """
+        chrome_options = Options()
+        
+        for argument in cls.HEADLESS_ARGS + cls.CHROME_ARGS if headless else cls.CHROME_ARGS:
+            chrome_options.add_argument(argument)
+        
+        chrome_options.add_experimental_option('excludeSwitches', ['enable-automation'])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
+        chrome_options.add_experimental_option('prefs', dict(cls.CHROME_PREFS))
+        
+        # Return from driver.get() at DOMContentLoaded instead of waiting for every sub-resource
+        chrome_options.page_load_strategy = 'eager'
+        return chrome_options
+    
     def quit_driver(self):
         """Close and quit the WebDriver"""
         if self.driver:
@@ -78,6 +151,15 @@ class WebDriverManager:
                 logger.error(f"Error closing WebDriver: {e}")
             finally:
                 self.driver = None
+                self._waits.clear()
+    
+    def _wait(self, timeout: float, poll_frequency: float = 0.1) -> WebDriverWait:
+        """Get the shared WebDriverWait for a timeout on the current driver."""
+        key = (timeout, poll_frequency)
+        wait = self._waits.get(key)
+        if wait is None:
+            wait = self._waits[key] = WebDriverWait(self.driver, timeout, poll_frequency=poll_frequency)
+        return wait
 
     def wait_for_element(self, selector: str, by: By = By.CSS_SELECTOR, timeout: int = None):
         """
@@ -98,10 +180,11 @@ class WebDriverManager:
             timeout = self.timeout
             
         try:
-            element = WebDriverWait(self.driver, timeout).until(
+            element = self._wait(timeout).until(
                 EC.presence_of_element_located((by, selector))
             )
-            logger.debug(f"Element found: {selector}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Element found: {selector}")
             return element
         except TimeoutException:
             logger.warning(f"Timeout waiting for element: {selector}")
@@ -118,30 +201,39 @@ class WebDriverManager:
         Returns:
             True if click succeeded, False otherwise
         """
+        # Keep the selector so a stale element can be located again
+        selector = element if isinstance(element, str) else None
+        
         for attempt in range(retries):
             try:
                 # If element is a string, find it first
                 if isinstance(element, str):
                     element = self.wait_for_element(element)
                 
-                # Scroll element into view
+                # Scroll element into view; an instant scroll has finished when the script returns
                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                time.sleep(0.3)  # Brief pause after scroll
+                
+                # Click as soon as the element is clickable rather than after a fixed pause
+                try:
+                    self._wait(2, poll_frequency=0.05).until(EC.element_to_be_clickable(element))
+                except TimeoutException:
+                    pass  # Let the click itself report what is in the way
                 
                 # Try to click
                 element.click()
-                logger.debug(f"Click successful on attempt {attempt + 1}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Click successful on attempt {attempt + 1}")
                 return True
                 
             except (StaleElementReferenceException, ElementClickInterceptedException) as e:
                 logger.warning(f"Click attempt {attempt + 1} failed: {type(e).__name__}")
                 
                 if attempt < retries - 1:
-                    time.sleep(0.5)  # Wait before retry
+                    # The next attempt waits for the element to be clickable again
                     # If element is stale, try to re-locate it
-                    if isinstance(e, StaleElementReferenceException) and isinstance(element, str):
+                    if isinstance(e, StaleElementReferenceException) and selector is not None:
                         try:
-                            element = self.wait_for_element(element)
+                            element = self.wait_for_element(selector)
                         except TimeoutException:
                             logger.error(f"Could not re-locate element after stale reference")
                             return False
@@ -166,9 +258,9 @@ class WebDriverManager:
             if isinstance(element, str):
                 element = self.wait_for_element(element)
             
-            # Scroll element into center of viewport
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});", element)
-            time.sleep(0.5)  # Wait for smooth scroll to complete
+            # Scroll element into center of viewport; an instant scroll is
+            # complete when the script returns, so there is nothing to wait for
+            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center', behavior: 'instant'});", element)
             logger.debug("Scrolled to element")
             
         except Exception as e:
@@ -10,13 +10,9 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
-def test_detail_scraper():
+def test_detail_scraper(driver):
     """Test the ProfessorDetailScraper with a real professor page."""
     
-    # Initialize WebDriver
-    driver_manager = WebDriverManager(headless=False)
-    driver = driver_manager.get_driver()
-    
     try:
         # Create scraper instance
         scraper = ProfessorDetailScraper(driver)
@@ -59,10 +55,14 @@ def test_detail_scraper():
         traceback.print_exc()
     
     finally:
-        # Clean up
-        driver_manager.quit_driver()
         print("\n" + "=" * 80)
         print("Test completed")
 
 if __name__ == "__main__":
-    test_detail_scraper()
+    # Initialize WebDriver
+    driver_manager = WebDriverManager(headless=False)
+    try:
+        test_detail_scraper(driver_manager.get_driver())
+    finally:
+        # Clean up
+        driver_manager.quit_driver()
@@ -1,5 +1,6 @@
 """Test error handler functionality."""
 
+import asyncio
 import time
 from src.utils.error_handler import ErrorHandler
 from src.utils.logger import setup_logging
@@ -26,6 +27,60 @@ def test_retry_with_backoff():
     assert attempt_count[0] == 3
 
 
+def test_retry_with_backoff_unrecoverable():
+    """Test that errors outside retry_on are raised without retrying."""
+    setup_logging("test_error_handler.log")
+    error_handler = ErrorHandler(max_retries=3)
+    
+    attempt_count = [0]
+    
+    def buggy_function():
+        attempt_count[0] += 1
+        raise KeyError("missing field")
+    
+    try:
+        error_handler.retry_with_backoff(buggy_function)
+        assert False, "KeyError was not raised"
+    except KeyError as e:
+        print(f"Raised: {e}")
+    print(f"Total attempts: {attempt_count[0]}")
+    assert attempt_count[0] == 1
+
+
+def test_retry_with_backoff_async():
+    """Test async retry skips non-retryable errors and retries the rest."""
+    setup_logging("test_error_handler.log")
+    error_handler = ErrorHandler(max_retries=3)
+    
+    attempt_count = [0]
+    
+    async def failing_function():
+        attempt_count[0] += 1
+        if attempt_count[0] < 2:
+            raise ConnectionError(f"Attempt {attempt_count[0]} failed")
+        raise ValueError("Not retryable")
+    
+    # ConnectionError is in retry_on by default, ValueError is not
+    try:
+        asyncio.run(error_handler.retry_with_backoff_async(failing_function))
+        assert False, "ValueError was not raised"
+    except ValueError as e:
+        print(f"Raised: {e}")
+    print(f"Total attempts: {attempt_count[0]}")
+    assert attempt_count[0] == 2
+    
+    # An explicit predicate overrides retry_on
+    attempt_count[0] = 0
+    try:
+        asyncio.run(error_handler.retry_with_backoff_async(
+            failing_function, is_retryable=lambda e: False
+        ))
+        assert False, "ConnectionError was not raised"
+    except ConnectionError as e:
+        print(f"Raised: {e}")
+    assert attempt_count[0] == 1
+
+
 def test_handle_missing_element():
     """Test handling missing element with single retry."""
     setup_logging("test_error_handler.log")
@@ -63,6 +118,10 @@ def test_log_error():
 if __name__ == "__main__":
     print("Testing retry with backoff...")
     test_retry_with_backoff()
+    print("\nTesting unrecoverable error is not retried...")
+    test_retry_with_backoff_unrecoverable()
+    print("\nTesting async retry with backoff...")
+    test_retry_with_backoff_async()
     print("\nTesting handle missing element...")
     test_handle_missing_element()
     print("\nTesting error logging...")
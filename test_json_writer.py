@@ -1,9 +1,11 @@
 """Test script for JSONWriter functionality."""
 
-import json
 import os
+import tempfile
 from pathlib import Path
 
+import orjson
+
 from src.models import Professor, Review
 from src.utils.json_writer import JSONWriter
 
@@ -83,62 +85,69 @@ def test_json_writer():
     is_valid = json_writer.validate_json_structure(serialized)
     print(f"   ✓ Validation result: {is_valid}")
     
-    # Test 3: Write to JSON file
-    print("\n3. Testing file writing...")
-    output_file = "test_output.json"
-    success = json_writer.write_json(serialized, output_file)
-    print(f"   ✓ Write result: {success}")
-    
-    # Test 4: Verify file exists and is valid JSON
-    print("\n4. Verifying output file...")
-    if os.path.exists(output_file):
-        with open(output_file, 'r', encoding='utf-8') as f:
-            loaded_data = json.load(f)
-        print(f"   ✓ File exists and contains {len(loaded_data)} professors")
-        print(f"   ✓ First professor: {loaded_data[0]['professor_name']}")
-        print(f"   ✓ Total reviews in file: {sum(len(p['reviews']) for p in loaded_data)}")
-    
-    # Test 5: Generate summary report
-    print("\n5. Testing summary report generation...")
-    errors = ["Error 1: Failed to load page", "Error 2: Element not found"]
-    skipped = ["Dr. Missing Person"]
-    summary = json_writer.generate_summary_report(professors, errors, skipped)
-    print(f"   ✓ Total professors: {summary['total_professors_scraped']}")
-    print(f"   ✓ Total reviews: {summary['total_reviews_collected']}")
-    print(f"   ✓ Average reviews per professor: {summary['average_reviews_per_professor']}")
-    print(f"   ✓ Errors encountered: {summary['errors_encountered']}")
-    print(f"   ✓ Professors skipped: {summary['professors_skipped']}")
-    
-    # Test 6: Log summary report
-    print("\n6. Testing summary report logging...")
-    json_writer.log_summary_report(summary)
-    
-    # Test 7: Save summary report
-    print("\n7. Testing summary report saving...")
-    summary_file = "test_summary.json"
-    success = json_writer.save_summary_report(summary, summary_file)
-    print(f"   ✓ Summary save result: {success}")
-    
-    # Test 8: Complete workflow
-    print("\n8. Testing complete workflow...")
-    complete_output = "test_complete_output.json"
-    success = json_writer.save_professors(professors, complete_output)
-    print(f"   ✓ Complete workflow result: {success}")
-    
-    print("\n" + "=" * 60)
-    print("All tests completed successfully!")
-    print("\nGenerated files:")
-    print(f"  - {output_file}")
-    print(f"  - {summary_file}")
-    print(f"  - {complete_output}")
-    print("\nYou can inspect these files to verify the output format.")
-    
-    # Cleanup
-    print("\nCleaning up test files...")
-    for file in [output_file, summary_file, complete_output]:
-        if os.path.exists(file):
-            os.remove(file)
-            print(f"  - Removed {file}")
+    # Output files go to a private directory that is removed with its contents
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Test 3: Write to JSON file
+        print("\n3. Testing file writing...")
+        output_file = os.path.join(tmp_dir, "test_output.json")
+        success = json_writer.write_json(serialized, output_file)
+        print(f"   ✓ Write result: {success}")
+        
+        # Test 4: Verify file exists and is valid JSON
+        print("\n4. Verifying output file...")
+        if os.path.exists(output_file):
+            with open(output_file, 'rb') as f:
+                loaded_data = orjson.loads(f.read())
+            print(f"   ✓ File exists and contains {len(loaded_data)} professors")
+            print(f"   ✓ First professor: {loaded_data[0]['professor_name']}")
+            print(f"   ✓ Total reviews in file: {sum(len(p['reviews']) for p in loaded_data)}")
+        
+        # Test 5: Generate summary report
+        print("\n5. Testing summary report generation...")
+        errors = ["Error 1: Failed to load page", "Error 2: Element not found"]
+        skipped = ["Dr. Missing Person"]
+        summary = json_writer.generate_summary_report(professors, errors, skipped)
+        print(f"   ✓ Total professors: {summary['total_professors_scraped']}")
+        print(f"   ✓ Total reviews: {summary['total_reviews_collected']}")
+        print(f"   ✓ Average reviews per professor: {summary['average_reviews_per_professor']}")
+        print(f"   ✓ Errors encountered: {summary['errors_encountered']}")
+        print(f"   ✓ Professors skipped: {summary['professors_skipped']}")
+        
+        # Test 6: Log summary report
+        print("\n6. Testing summary report logging...")
+        json_writer.log_summary_report(summary)
+        
+        # Test 7: Save summary report
+        print("\n7. Testing summary report saving...")
+        summary_file = os.path.join(tmp_dir, "test_summary.json")
+        success = json_writer.save_summary_report(summary, summary_file)
+        print(f"   ✓ Summary save result: {success}")
+        
+        # Test 8: Complete workflow, streamed from a one-shot iterator
+        print("\n8. Testing complete workflow...")
+        complete_output = os.path.join(tmp_dir, "test_complete_output.json")
+        success = json_writer.save_professors(iter(professors), complete_output)
+        print(f"   ✓ Complete workflow result: {success}")
+        assert success
+        with open(complete_output, 'rb') as f:
+            streamed_data = orjson.loads(f.read())
+        assert [p['professor_name'] for p in streamed_data] == [p.professor_name for p in professors]
+        assert sum(len(p['reviews']) for p in streamed_data) == 3
+        
+        # A record missing a required field aborts the write and keeps the old file
+        broken = professors + [{'professor_name': 'Dr. Incomplete'}]
+        assert not json_writer.save_professors(iter(broken), complete_output)
+        with open(complete_output, 'rb') as f:
+            assert orjson.loads(f.read()) == streamed_data
+        assert not os.path.exists(complete_output + ".tmp")
+        print("   ✓ Incomplete record aborted the write")
+        
+        print("\n" + "=" * 60)
+        print("All tests completed successfully!")
+        print("\nGenerated files:")
+        print(f"  - {output_file}")
+        print(f"  - {summary_file}")
+        print(f"  - {complete_output}")
 
 
 if __name__ == "__main__":
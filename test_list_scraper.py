@@ -10,13 +10,9 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
-def test_list_scraper():
+def test_list_scraper(driver):
     """Test the professor list scraper with a limited run"""
     
-    # Initialize WebDriver
-    manager = WebDriverManager(headless=False)  # Set to False to see the browser
-    driver = manager.get_driver()
-    
     try:
         # Create scraper instance
         base_url = "https://www.ratemyprofessors.com/search/professors/1262?q=*"
@@ -45,10 +41,12 @@ def test_list_scraper():
         print(f"Error during test: {e}")
         import traceback
         traceback.print_exc()
-    
+
+if __name__ == "__main__":
+    # Initialize WebDriver
+    manager = WebDriverManager(headless=False)  # Set to False to see the browser
+    try:
+        test_list_scraper(manager.get_driver())
     finally:
         # Clean up
         manager.quit_driver()
-
-if __name__ == "__main__":
-    test_list_scraper()
@@ -0,0 +1,147 @@
+"""Test script for parsing embedded professor page data."""
+
+import json
+
+from src.scrapers.page_data import extract_teacher_data, build_professor, build_summary
+from src.utils.cleaner import DataCleaner
+
+
+RELAY_STORE = {
+    "VGVhY2hlci0x": {
+        "__id": "VGVhY2hlci0x",
+        "__typename": "Teacher",
+        "firstName": "John",
+        "lastName": "Smith",
+        "department": "Computer Science",
+        "avgRating": 4.3,
+        "avgDifficulty": 3.2,
+        "wouldTakeAgainPercent": 85.4,
+        "ratingsDistribution": {"__ref": "client:VGVhY2hlci0x:ratingsDistribution"},
+        "teacherRatingTags": {"__refs": ["tag-1", "tag-2"]},
+        "ratings(first:20)": {"__ref": "client:VGVhY2hlci0x:ratings(first:20)"}
+    },
+    "client:VGVhY2hlci0x:ratingsDistribution": {
+        "r1": 0, "r2": 1, "r3": 3, "r4": 8, "r5": 15, "total": 27
+    },
+    "tag-1": {"tagName": "Caring", "tagCount": 5},
+    "tag-2": {"tagName": "Tough grader", "tagCount": 2},
+    "client:VGVhY2hlci0x:ratings(first:20)": {
+        "edges": {"__refs": ["edge-1"]}
+    },
+    "edge-1": {"node": {"__ref": "UmF0aW5nLTE="}},
+    "UmF0aW5nLTE=": {
+        "__typename": "Rating",
+        "class": "CSC101",
+        "isForCredit": True,
+        "attendanceMandatory": "mandatory",
+        "grade": "A",
+        "textbookUse": -1,
+        "qualityRating": 5,
+        "difficultyRatingRounded": 3,
+        "comment": "Great professor, very helpful!",
+        "ratingTags": "Caring--Clear grading criteria",
+        "date": "2023-05-15 00:00:00 +0000 UTC",
+        "thumbsUpTotal": 10,
+        "thumbsDownTotal": 1
+    }
+}
+
+
+def test_extract_relay_store():
+    """Test that the relay store is found and converted to a Professor."""
+    html = (
+        "<html><head><script>window.__RELAY_STORE__ = "
+        + json.dumps(RELAY_STORE)
+        + ";window.process = {};</script></head><body></body></html>"
+    )
+
+    teacher = extract_teacher_data(html)
+    assert teacher is not None, "Teacher record not found"
+
+    professor = build_professor(teacher)
+    assert professor.professor_name == "John Smith"
+    assert professor.department == "Computer Science"
+    assert professor.overall_quality == 4.3
+    assert professor.would_take_again == 85
+    assert professor.rating_distribution == {"Awesome": 15, "Great": 8, "Good": 3, "OK": 1, "Awful": 0}
+    assert professor.tags == ["Caring", "Tough grader"]
+
+    assert len(professor.reviews) == 1
+    review = professor.reviews[0]
+    assert review.course_code == "CSC101"
+    assert review.attendance == "Mandatory"
+    assert review.textbook_used == "Not Specified"
+    assert review.quality_score == 5.0
+    assert review.tags == ["Caring", "Clear grading criteria"]
+    assert review.helpful_upvotes == 10
+    print("✓ Relay store parsed correctly")
+
+
+def test_missing_page_data():
+    """Test that pages without embedded data return None."""
+    assert extract_teacher_data("<html><body>Loading...</body></html>") is None
+    assert extract_teacher_data("") is None
+    print("✓ Missing page data handled")
+
+
+def test_distribution_from_reviews():
+    """Test that the distribution is counted from reviews when the page has none."""
+    teacher = {
+        "firstName": "Jane",
+        "lastName": "Doe",
+        "ratings": {"edges": [
+            {"node": {"qualityRating": 5}},
+            {"node": {"qualityRating": 5}},
+            {"node": {"qualityRating": 4}},
+            {"node": {"qualityRating": 1}}
+        ]}
+    }
+
+    professor = build_professor(teacher)
+    assert professor.rating_distribution == {"Awesome": 2, "Great": 1, "Good": 0, "OK": 0, "Awful": 1}
+    print("✓ Distribution counted from reviews")
+
+
+def test_build_summary():
+    """Test that a teacher search result maps onto a ProfessorSummary."""
+    summary = build_summary({
+        "legacyId": 123456,
+        "firstName": "John",
+        "lastName": "Smith",
+        "department": "Computer Science",
+        "avgRating": 4.3,
+        "avgDifficulty": 3.2,
+        "wouldTakeAgainPercent": -1,
+        "numRatings": 27,
+        "school": {"name": "University of South Florida"}
+    })
+
+    assert summary.professor_name == "John Smith"
+    assert summary.university == "University of South Florida"
+    assert summary.num_ratings == 27
+    assert summary.would_take_again_pct is None
+    assert summary.professor_page_url == "https://www.ratemyprofessors.com/professor/123456"
+    print("✓ Search result parsed correctly")
+
+
+def test_percentage_rounding_matches_listing():
+    """Test that API records and listing cards round .5 percentages the same way."""
+    for percentage, expected in ((12.5, 13), (4.5, 5), (85.4, 85)):
+        summary = build_summary({
+            "legacyId": 1,
+            "firstName": "John",
+            "lastName": "Smith",
+            "wouldTakeAgainPercent": percentage
+        })
+        assert summary.would_take_again_pct == expected
+        assert DataCleaner.parse_percentage(f"{percentage}%") == expected
+    print("✓ Percentages rounded half up on both paths")
+
+
+if __name__ == "__main__":
+    test_extract_relay_store()
+    test_missing_page_data()
+    test_distribution_from_reviews()
+    test_build_summary()
+    test_percentage_rounding_matches_listing()
+    print("\nAll tests passed!")
@@ -0,0 +1,61 @@
+"""Test script for ProfessorCache."""
+
+import tempfile
+
+from src.models import Professor, Review
+from src.utils.professor_cache import ProfessorCache
+
+
+def _professor():
+    review = Review(
+        course_code="COP3514",
+        for_credit=True,
+        attendance="Mandatory",
+        grade="A",
+        textbook_used="No",
+        quality_score=5.0,
+        difficulty_score=2.0,
+        review_text="Great class",
+        tags=["Clear grading criteria"],
+        date_posted="Jan 1st, 2024",
+        helpful_upvotes=3,
+        helpful_downvotes=0
+    )
+    return Professor(
+        professor_name="Jane Smith",
+        department="Computer Science",
+        overall_quality=4.5,
+        difficulty_level=2.5,
+        would_take_again=90,
+        rating_distribution={"Awesome": 1, "Great": 0, "Good": 0, "OK": 0, "Awful": 0},
+        tags=["Caring"],
+        reviews=[review]
+    )
+
+
+def test_cache_round_trip():
+    """Test that a cached professor is returned unchanged."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ProfessorCache(tmp)
+        professor = _professor()
+
+        assert cache.get("VGVhY2hlci0x") is None
+        cache.set("VGVhY2hlci0x", professor)
+        assert cache.get("VGVhY2hlci0x") == professor
+        print("Cached professor round-trips correctly")
+
+
+def test_expired_entry_is_ignored():
+    """Test that entries older than expire_after are treated as missing."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ProfessorCache(tmp, expire_after=-1)
+        cache.set("VGVhY2hlci0x", _professor())
+
+        assert cache.get("VGVhY2hlci0x") is None
+        print("Expired cache entry is ignored")
+
+
+if __name__ == "__main__":
+    test_cache_round_trip()
+    test_expired_entry_is_ignored()
+    print("\nAll tests passed!")
@@ -1,7 +1,10 @@
 """Unit test for save_to_json functionality"""
 
-import json
 import os
+import tempfile
+
+import orjson
+
 from src.models import ProfessorSummary
 from src.scrapers.list_scraper import ProfessorListScraper
 
@@ -45,57 +48,55 @@ def test_save_to_json():
     # Create a scraper instance (we don't need driver for this test)
     scraper = ProfessorListScraper(driver=None, base_url="")
     
-    # Test file path
-    test_output = "test_usf_professors_main.json"
-    
-    try:
-        # Save to JSON
-        scraper.save_to_json(mock_professors, test_output)
-        
-        # Verify file was created
-        assert os.path.exists(test_output), "Output file was not created"
-        
-        # Read and verify the JSON content
-        with open(test_output, 'r', encoding='utf-8') as f:
-            loaded_data = json.load(f)
-        
-        # Verify structure
-        assert len(loaded_data) == 3, f"Expected 3 professors, got {len(loaded_data)}"
+    # The output file lives in a private directory that is removed afterwards
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Test file path
+        test_output = os.path.join(tmp_dir, "test_usf_professors_main.json")
         
-        # Verify first professor
-        prof1 = loaded_data[0]
-        assert prof1['professor_name'] == "Dr. John Smith"
-        assert prof1['department'] == "Computer Science"
-        assert prof1['num_ratings'] == 50
-        assert prof1['avg_quality'] == 4.5
-        assert prof1['would_take_again_pct'] == 85
-        
-        # Verify UTF-8 encoding with special characters
-        prof2 = loaded_data[1]
-        assert prof2['professor_name'] == "Dr. María García", "UTF-8 special characters not preserved"
-        
-        # Verify UTF-8 encoding with Chinese characters
-        prof3 = loaded_data[2]
-        assert prof3['professor_name'] == "Dr. 李明", "UTF-8 Chinese characters not preserved"
-        assert prof3['would_take_again_pct'] is None, "Optional field should be None"
-        
-        print("✓ All tests passed!")
-        print(f"✓ File created: {test_output}")
-        print(f"✓ UTF-8 encoding verified")
-        print(f"✓ Data structure validated")
-        print(f"✓ Optional fields handled correctly")
-        
-    except AssertionError as e:
-        print(f"✗ Test failed: {e}")
-        raise
-    except Exception as e:
-        print(f"✗ Error during test: {e}")
-        raise
-    finally:
-        # Clean up test file
-        if os.path.exists(test_output):
-            os.remove(test_output)
-            print(f"✓ Cleaned up test file: {test_output}")
+        try:
+            # Save to JSON
+            scraper.save_to_json(mock_professors, test_output)
+            
+            # Verify file was created
+            assert os.path.exists(test_output), "Output file was not created"
+            
+            # Read and verify the JSON content
+            with open(test_output, 'rb') as f:
+                loaded_data = orjson.loads(f.read())
+            
+            # Verify structure
+            assert len(loaded_data) == 3, f"Expected 3 professors, got {len(loaded_data)}"
+            
+            # Verify first professor
+            prof1 = loaded_data[0]
+            assert prof1['professor_name'] == "Dr. John Smith"
+            assert prof1['department'] == "Computer Science"
+            assert prof1['num_ratings'] == 50
+            assert prof1['avg_quality'] == 4.5
+            assert prof1['would_take_again_pct'] == 85
+            
+            # Verify UTF-8 encoding with special characters
+            prof2 = loaded_data[1]
+            assert prof2['professor_name'] == "Dr. María García", "UTF-8 special characters not preserved"
+            
+            # Verify UTF-8 encoding with Chinese characters
+            prof3 = loaded_data[2]
+            assert prof3['professor_name'] == "Dr. 李明", "UTF-8 Chinese characters not preserved"
+            assert prof3['would_take_again_pct'] is None, "Optional field should be None"
+            
+            print("✓ All tests passed!")
+            print(f"✓ File created: {test_output}")
+            print(f"✓ UTF-8 encoding verified")
+            print(f"✓ Data structure validated")
+            print(f"✓ Optional fields handled correctly")
+            
+        except AssertionError as e:
+            print(f"✗ Test failed: {e}")
+            raise
+        except Exception as e:
+            print(f"✗ Error during test: {e}")
+            raise
+
 
 if __name__ == "__main__":
     test_save_to_json()
@@ -0,0 +1,57 @@
+"""Test script for TokenBucket rate limiter."""
+
+import asyncio
+import time
+
+from src.utils.token_bucket import TokenBucket
+
+
+def test_acquire_respects_rate():
+    """Test that requests beyond the burst capacity are paced at the refill rate."""
+    async def _acquire_all():
+        bucket = TokenBucket(rate=20, capacity=2)
+        start = time.monotonic()
+        for _ in range(6):
+            await bucket.acquire()
+        return time.monotonic() - start
+
+    elapsed = asyncio.run(_acquire_all())
+    print(f"Acquired 6 tokens in {elapsed:.2f}s")
+    # 2 tokens are available immediately, the remaining 4 refill at 20/s
+    assert elapsed >= 0.18
+
+
+def test_backoff_and_recover():
+    """Test that backoff halves the rate and recovery ramps it back up."""
+    bucket = TokenBucket(rate=1.0, capacity=1, cooldown=0.0)
+    bucket.backoff()
+    assert bucket.rate == 0.5
+
+    bucket.recover()
+    assert abs(bucket.rate - 0.55) < 1e-9
+
+    for _ in range(20):
+        bucket.recover()
+    assert bucket.rate == 1.0
+    print("Backoff and recovery work correctly")
+
+
+def test_backoff_once_per_cooldown():
+    """Test that repeated overloads during a cooldown halve the rate only once."""
+    bucket = TokenBucket(rate=1.0, capacity=1, cooldown=60.0)
+    for _ in range(10):
+        bucket.backoff()
+    assert bucket.rate == 0.5
+
+    bucket = TokenBucket(rate=1.0, capacity=1, cooldown=0.0)
+    for _ in range(10):
+        bucket.backoff()
+    assert bucket.rate == 0.125
+    print("Backoff is limited per cooldown and clamped to the minimum rate")
+
+
+if __name__ == "__main__":
+    test_acquire_respects_rate()
+    test_backoff_and_recover()
+    test_backoff_once_per_cooldown()
+    print("\nAll tests passed!")
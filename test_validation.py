@@ -0,0 +1,63 @@
+"""Test script for bulk validation of scraped records."""
+
+from src.models import ProfessorSummary
+from src.utils.validation import validate_summaries, validate_professor_records
+
+
+def _summary(**overrides):
+    data = dict(
+        professor_name="Jane Smith",
+        department="Computer Science",
+        university="University of South Florida",
+        num_ratings=10,
+        avg_quality=4.5,
+        avg_difficulty=2.5,
+        would_take_again_pct=90,
+        professor_page_url="https://www.ratemyprofessors.com/professor/1"
+    )
+    data.update(overrides)
+    return ProfessorSummary(**data)
+
+
+def test_validate_summaries():
+    """Test that the first offending summary is reported per field."""
+    assert validate_summaries([_summary(), _summary()]) == []
+
+    problems = validate_summaries([_summary(), _summary(avg_quality=6.0), _summary(professor_name="  ")])
+    print(problems)
+    assert problems == [
+        "professor_name is required (record 2)",
+        "avg_quality must be between 0 and 5, got 6.0 (record 1)"
+    ]
+
+
+def test_validate_professor_records():
+    """Test that professor and review fields are checked across all records."""
+    review = {
+        "course_code": "COP3514",
+        "quality_score": 5.0,
+        "difficulty_score": 2.0,
+        "helpful_upvotes": 1,
+        "helpful_downvotes": 0
+    }
+    records = [
+        {"professor_name": "Jane Smith", "department": "Math", "overall_quality": 4.0,
+         "difficulty_level": 3.0, "would_take_again": None, "reviews": [review]},
+        {"professor_name": "John Doe", "department": "Math", "overall_quality": 4.0,
+         "difficulty_level": 3.0, "would_take_again": 120,
+         "reviews": [review, dict(review, helpful_upvotes=-1)]}
+    ]
+
+    problems = validate_professor_records(records)
+    print(problems)
+    assert problems == [
+        "would_take_again must be between 0 and 100, got 120 (record 1)",
+        "review helpful_upvotes must be non-negative, got -1 (record 1)"
+    ]
+    assert validate_professor_records(records[:1]) == []
+
+
+if __name__ == "__main__":
+    test_validate_summaries()
+    test_validate_professor_records()
+    print("\nAll tests passed!")